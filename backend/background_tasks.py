@@ -10,7 +10,7 @@ import threading
 import logging
 
 from database import get_db
-from zoho_client import zoho_client
+from zoho_client import get_zoho_client
 from utils import process_interpreter_import
 from rate_limiter import zoho_rate_limiter
 
@@ -147,7 +147,7 @@ def background_import_zoho_candidates(
 
         # Fetch filtered candidates from Zoho Contacts module
         logger.info(f"Job {job_id}: Fetching candidates with criteria: {criteria}")
-        candidates = zoho_client.get_all_records(
+        candidates = get_zoho_client().get_all_records(
             module_name="Contacts",
             criteria=criteria,
             max_records=max_records
@@ -17,8 +17,8 @@ import time
 from database import engine, get_db
 from models import Base, Interpreter, InterpreterLanguage, Client, ClientRate, Payment, PaymentBatch, SyncOperation, SyncLog, SyncStatus
 import schemas
-from zoho_client import zoho_client
-from zoho_books_client import zoho_books_client
+from zoho_client import get_zoho_client
+from zoho_books_client import get_zoho_books_client
 from utils import (
     map_zoho_contact_to_interpreter,
     process_interpreter_import,
@@ -321,7 +321,10 @@ def sync_interpreters_from_zoho_sheet(db: Session = Depends(get_db)):
 
         candidates = fetch_zoho_interpreter_csv(csv_url)
 
-        if not candidates:
+        # Process import with smart merge (consumes the CSV stream row by row)
+        result = process_interpreter_import(candidates, db, update_existing=True)
+
+        if not result["total"]:
             return {
                 "success": True,
                 "message": "No data found in Zoho Sheet",
@@ -338,9 +341,6 @@ def sync_interpreters_from_zoho_sheet(db: Session = Depends(get_db)):
                 "errors": []
             }
 
-        # Process import with smart merge
-        result = process_interpreter_import(candidates, db, update_existing=True)
-
         # Commit all changes
         db.commit()
 
@@ -375,7 +375,7 @@ def sync_interpreters_from_zoho_sheet(db: Session = Depends(get_db)):
                 "updated": len(result["updated"]),
                 "skipped": len(result["skipped"]),
                 "errors": len(result["errors"]),
-                "total": len(candidates)
+                "total": result["total"]
             },
             "created": created_details,
             "updated": updated_details,
@@ -400,7 +400,7 @@ def sync_interpreters_from_zoho_sheet(db: Session = Depends(get_db)):
 def get_zoho_modules():
     """Get all available Zoho CRM modules"""
     try:
-        modules = zoho_client.get_modules()
+        modules = get_zoho_client().get_modules()
         return {
             "success": True,
             "modules": modules,
@@ -413,10 +413,10 @@ def get_zoho_modules():
 def get_zoho_fields(module_name: Optional[str] = None):
     """Get available fields from Zoho CRM module"""
     try:
-        fields = zoho_client.get_module_fields(module_name)
+        fields = get_zoho_client().get_module_fields(module_name)
         return {
             "success": True,
-            "module": module_name or zoho_client.module_name,
+            "module": module_name or get_zoho_client().module_name,
             "fields": fields,
             "total": len(fields)
         }
@@ -427,7 +427,7 @@ def get_zoho_fields(module_name: Optional[str] = None):
 def test_zoho_sheet():
     """Test Zoho Sheet API access"""
     try:
-        data = zoho_client.get_sheet_data()
+        data = get_zoho_client().get_sheet_data()
         return {
             "success": True,
             "row_count": len(data),
@@ -458,7 +458,7 @@ def get_zoho_filter_options(module: Optional[str] = "Contacts"):
 
         # Fetch sample records to extract common filter values
         # (Fetching all 4000+ would be too slow just for dropdowns)
-        records = zoho_client.get_all_records(
+        records = get_zoho_client().get_all_records(
             module_name=module,
             max_records=1000  # Fetch enough to get most common values
         )
@@ -563,7 +563,7 @@ def get_zoho_candidates(
         # When filtering, fetch all records; otherwise just fetch what's needed
         fetch_limit = None if (onboarding_status or language or service_location) else limit
 
-        all_records = zoho_client.get_all_records(
+        all_records = get_zoho_client().get_all_records(
             module_name=module or "Contacts",
             max_records=fetch_limit
         )
@@ -682,7 +682,7 @@ def import_zoho_candidates(
         criteria = "and".join(criteria_parts) if criteria_parts else None
 
         # Fetch filtered candidates from Zoho Contacts module
-        candidates = zoho_client.get_all_records(
+        candidates = get_zoho_client().get_all_records(
             module_name="Contacts",
             criteria=criteria,
             max_records=max_records
@@ -863,7 +863,7 @@ def import_selected_candidates(
                 zoho_rate_limiter.wait_if_needed()
 
                 # Fetch individual candidate record
-                response = zoho_client.get_records(
+                response = get_zoho_client().get_records(
                     module_name=module,
                     page=1,
                     per_page=1,
@@ -1659,7 +1659,9 @@ def force_sync(
                 from database import SessionLocal
                 bg_db = SessionLocal()
                 try:
-                    run_sync(request.module, "manual", bg_db)
+                    # Nobody waits on this response, so a Bulk Read job's
+                    # polling is fine here
+                    run_sync(request.module, "manual", bg_db, bulk=True)
                 finally:
                     bg_db.close()
             finally:
@@ -2015,7 +2017,7 @@ def refresh_database(
 def get_zoho_books_organizations(db: Session = Depends(get_db)):
     """Get all Zoho Books organizations for discovering organization_id"""
     try:
-        orgs = zoho_books_client.get_organizations()
+        orgs = get_zoho_books_client().get_organizations()
         return {
             "organizations": orgs,
             "total": len(orgs)
@@ -2036,7 +2038,7 @@ def get_chart_of_accounts(
         account_type: Filter by account type (e.g., 'expense', 'income', 'asset')
     """
     try:
-        accounts = zoho_books_client.get_chart_of_accounts(account_type=account_type)
+        accounts = get_zoho_books_client().get_chart_of_accounts(account_type=account_type)
         return {
             "accounts": accounts,
             "total": len(accounts)
@@ -2059,7 +2061,7 @@ def get_expense_accounts(
         limit: Maximum number of results to return (default: 50)
     """
     try:
-        accounts = zoho_books_client.get_expense_accounts(search=search, limit=limit)
+        accounts = get_zoho_books_client().get_expense_accounts(search=search, limit=limit)
         return {
             "accounts": accounts,
             "total": len(accounts)
@@ -2072,7 +2074,7 @@ def get_expense_accounts(
 def get_vendors(db: Session = Depends(get_db)):
     """Get all vendor contacts from Zoho Books"""
     try:
-        vendors = zoho_books_client.get_contacts(contact_type="vendor")
+        vendors = get_zoho_books_client().get_contacts(contact_type="vendor")
         return {
             "vendors": vendors,
             "total": len(vendors)
@@ -2092,7 +2094,7 @@ def create_vendor(
 ):
     """Create a new vendor contact in Zoho Books"""
     try:
-        vendor = zoho_books_client.create_vendor_contact(
+        vendor = get_zoho_books_client().create_vendor_contact(
             contact_name=contact_name,
             email=email,
             phone=phone,
@@ -2118,7 +2120,7 @@ def get_bills(
         status: Filter by status (draft, open, paid, void, overdue)
     """
     try:
-        bills = zoho_books_client.get_bills(vendor_id=vendor_id, status=status)
+        bills = get_zoho_books_client().get_bills(vendor_id=vendor_id, status=status)
         return {
             "bills": bills,
             "total": len(bills)
@@ -2131,7 +2133,7 @@ def get_bills(
 def get_bill(bill_id: str, db: Session = Depends(get_db)):
     """Get a specific bill by ID"""
     try:
-        bill = zoho_books_client.get_bill(bill_id)
+        bill = get_zoho_books_client().get_bill(bill_id)
         return bill
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Bill not found: {str(e)}")
@@ -2163,7 +2165,7 @@ def create_bill(
         reference_number: External reference (e.g., employee ID)
     """
     try:
-        bill = zoho_books_client.create_bill(
+        bill = get_zoho_books_client().create_bill(
             vendor_id=vendor_id,
             line_items=line_items,
             bill_number=bill_number,
@@ -2178,6 +2180,43 @@ def create_bill(
         raise HTTPException(status_code=500, detail=f"Failed to create bill: {str(e)}")
 
 
+def get_payment_bill_data(payment_id: str, db: Session):
+    """
+    Load a payment and its interpreter as the dictionaries used for Zoho Books bills
+
+    Returns:
+        Tuple of (interpreter_data, payment_data)
+    """
+    # Get payment from database
+    payment = db.query(Payment).filter(Payment.id == payment_id).first()
+    if not payment:
+        raise HTTPException(status_code=404, detail="Payment not found")
+
+    # Get interpreter from database
+    interpreter = db.query(Interpreter).filter(Interpreter.id == payment.interpreter_id).first()
+    if not interpreter:
+        raise HTTPException(status_code=404, detail="Interpreter not found")
+
+    # Convert to dictionaries for the helper method
+    interpreter_data = {
+        "contact_name": interpreter.contact_name,
+        "email": interpreter.email,
+        "employee_id": interpreter.employee_id,
+        "company_name": interpreter.contact_name
+    }
+
+    payment_data = {
+        "language": interpreter.language,
+        "period": payment.period,
+        "client_name": payment.client_name,
+        "total_hours": payment.total_hours,
+        "rate_per_hour": payment.rate_per_hour,
+        "total_amount": payment.total_amount
+    }
+
+    return interpreter_data, payment_data
+
+
 @app.post("/api/zoho-books/bills/from-payment/{payment_id}")
 def create_bill_from_payment(
     payment_id: str,
@@ -2194,35 +2233,10 @@ def create_bill_from_payment(
         auto_generate_bill_number: Whether to auto-generate bill number
     """
     try:
-        # Get payment from database
-        payment = db.query(Payment).filter(Payment.id == payment_id).first()
-        if not payment:
-            raise HTTPException(status_code=404, detail="Payment not found")
-
-        # Get interpreter from database
-        interpreter = db.query(Interpreter).filter(Interpreter.id == payment.interpreter_id).first()
-        if not interpreter:
-            raise HTTPException(status_code=404, detail="Interpreter not found")
-
-        # Convert to dictionaries for the helper method
-        interpreter_data = {
-            "contact_name": interpreter.contact_name,
-            "email": interpreter.email,
-            "employee_id": interpreter.employee_id,
-            "company_name": interpreter.contact_name
-        }
-
-        payment_data = {
-            "language": interpreter.language,
-            "period": payment.period,
-            "client_name": payment.client_name,
-            "total_hours": payment.total_hours,
-            "rate_per_hour": payment.rate_per_hour,
-            "total_amount": payment.total_amount
-        }
+        interpreter_data, payment_data = get_payment_bill_data(payment_id, db)
 
         # Create bill using helper method
-        bill = zoho_books_client.create_bill_from_payment(
+        bill = get_zoho_books_client().create_bill_from_payment(
             interpreter_data=interpreter_data,
             payment_data=payment_data,
             default_account_id=account_id,
@@ -2259,14 +2273,30 @@ def create_bills_from_payments(
         "errors": []
     }
 
+    # Load payment data from the database first
+    loaded_ids = []
+    payments = []
     for payment_id in payment_ids:
         try:
-            bill = create_bill_from_payment(
-                payment_id=payment_id,
-                account_id=account_id,
-                auto_generate_bill_number=auto_generate_bill_number,
-                db=db
-            )
+            payments.append(get_payment_bill_data(payment_id, db))
+            loaded_ids.append(payment_id)
+        except HTTPException as e:
+            results["failed"] += 1
+            results["errors"].append({
+                "payment_id": payment_id,
+                "error": e.detail
+            })
+
+    # Create the bills in Zoho Books with parallel API calls
+    bill_results = get_zoho_books_client().create_bills_from_payments(
+        payments,
+        default_account_id=account_id,
+        auto_generate_bill_number=auto_generate_bill_number
+    )
+
+    for payment_id, result in zip(loaded_ids, bill_results):
+        if result["success"]:
+            bill = result["bill"]
             results["successful"] += 1
             results["bills"].append({
                 "payment_id": payment_id,
@@ -2274,11 +2304,11 @@ def create_bills_from_payments(
                 "bill_number": bill.get("bill_number"),
                 "status": "success"
             })
-        except Exception as e:
+        else:
             results["failed"] += 1
             results["errors"].append({
                 "payment_id": payment_id,
-                "error": str(e)
+                "error": result["error"]
             })
 
     return results
@@ -2303,9 +2333,9 @@ def get_zoho_books_items(
     """
     try:
         if search:
-            items = zoho_books_client.search_items(search)
+            items = get_zoho_books_client().search_items(search)
         else:
-            items = zoho_books_client.get_items(item_type=item_type, status=status)
+            items = get_zoho_books_client().get_items(item_type=item_type, status=status)
         return {"items": items}
     except Exception as e:
         raise HTTPException(
@@ -2334,9 +2364,9 @@ def fetch_items_for_sync_route(
     try:
         # Fetch items from Zoho Books
         if search:
-            items = zoho_books_client.search_items(search)
+            items = get_zoho_books_client().search_items(search)
         else:
-            items = zoho_books_client.get_items(status=status, organization_id=organization_id)
+            items = get_zoho_books_client().get_items(status=status, organization_id=organization_id)
 
         # Get all existing client_rates with external_item_id to check for duplicates
         existing_rates = db.query(ClientRate).filter(
@@ -2402,7 +2432,7 @@ def fetch_items_for_sync_route(
 def get_zoho_books_item(item_id: str, db: Session = Depends(get_db)):
     """Get a specific item by ID"""
     try:
-        item = zoho_books_client.get_item(item_id)
+        item = get_zoho_books_client().get_item(item_id)
         return {"item": item}
     except Exception as e:
         raise HTTPException(
@@ -2439,7 +2469,7 @@ def create_zoho_books_item(
         sku: Stock keeping unit
     """
     try:
-        item = zoho_books_client.create_item(
+        item = get_zoho_books_client().create_item(
             name=name,
             rate=rate,
             description=description,
@@ -2466,7 +2496,7 @@ def update_zoho_books_item(
 ):
     """Update an existing item in Zoho Books"""
     try:
-        item = zoho_books_client.update_item(item_id, data)
+        item = get_zoho_books_client().update_item(item_id, data)
         return {"item": item}
     except Exception as e:
         raise HTTPException(
@@ -2479,7 +2509,7 @@ def update_zoho_books_item(
 def delete_zoho_books_item(item_id: str, db: Session = Depends(get_db)):
     """Delete an item from Zoho Books"""
     try:
-        result = zoho_books_client.delete_item(item_id)
+        result = get_zoho_books_client().delete_item(item_id)
         return result
     except Exception as e:
         raise HTTPException(
@@ -2492,7 +2522,7 @@ def delete_zoho_books_item(item_id: str, db: Session = Depends(get_db)):
 def mark_item_active(item_id: str, db: Session = Depends(get_db)):
     """Mark an item as active"""
     try:
-        result = zoho_books_client.mark_item_as_active(item_id)
+        result = get_zoho_books_client().mark_item_as_active(item_id)
         return result
     except Exception as e:
         raise HTTPException(
@@ -2505,7 +2535,7 @@ def mark_item_active(item_id: str, db: Session = Depends(get_db)):
 def mark_item_inactive(item_id: str, db: Session = Depends(get_db)):
     """Mark an item as inactive"""
     try:
-        result = zoho_books_client.mark_item_as_inactive(item_id)
+        result = get_zoho_books_client().mark_item_as_inactive(item_id)
         return result
     except Exception as e:
         raise HTTPException(
@@ -2520,7 +2550,7 @@ def mark_item_inactive(item_id: str, db: Session = Depends(get_db)):
 def get_zoho_books_organizations(db: Session = Depends(get_db)):
     """Get all Zoho Books organizations the user has access to"""
     try:
-        organizations = zoho_books_client.get_organizations()
+        organizations = get_zoho_books_client().get_organizations()
         return {"organizations": organizations}
     except Exception as e:
         raise HTTPException(
@@ -66,5 +66,62 @@ class RateLimiter:
             self.acquire()
 
 
+class TokenBucket:
+    """
+    Blocking token bucket for smoothing concurrent API calls
+
+    Tokens refill continuously at `rate` per second up to `capacity`;
+    acquire() blocks until a token is available. pause() empties the bucket
+    for a while, e.g. when the server answers 429 with a Retry-After, so
+    every thread sharing the bucket backs off together.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize token bucket
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update (caller holds the lock)"""
+        if now > self._paused_until:
+            start = max(self._updated, self._paused_until)
+            self._tokens = min(self.capacity, self._tokens + (now - start) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> None:
+        """Take one token, waiting until one is available"""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    wait = (1 - self._tokens) / self.rate
+                self._cond.wait(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next `seconds` seconds"""
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = 0.0
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._cond.notify_all()
+
+
 # Global rate limiter for Zoho API
 zoho_rate_limiter = RateLimiter(max_calls=10, time_window=10)
@@ -2,7 +2,7 @@
 """
 Search for Zoho One Subscription in Chart of Accounts
 """
-from zoho_books_client import zoho_books_client
+from zoho_books_client import get_zoho_books_client
 import json
 
 def search_account(search_term="Zoho One"):
@@ -10,7 +10,7 @@ def search_account(search_term="Zoho One"):
     print(f'Fetching all accounts from Zoho Books...')
 
     try:
-        all_accounts = zoho_books_client.get_chart_of_accounts()
+        all_accounts = get_zoho_books_client().get_chart_of_accounts()
         print(f'✓ Retrieved {len(all_accounts)} accounts')
 
         # Search for accounts containing the search term
@@ -2,7 +2,7 @@
 """
 Search for Zoho Books Items and show their expense account associations
 """
-from zoho_books_client import zoho_books_client
+from zoho_books_client import get_zoho_books_client
 import json
 
 def search_item(search_term="Spanish"):
@@ -11,7 +11,7 @@ def search_item(search_term="Spanish"):
 
     try:
         # Search for items
-        items = zoho_books_client.search_items(search_term)
+        items = get_zoho_books_client().search_items(search_term)
         print(f'✅ Found {len(items)} item(s)\n')
 
         if items:
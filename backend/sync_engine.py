@@ -9,12 +9,11 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 
 from models import SyncOperation, SyncLog, SyncStatus
-from zoho_client import zoho_client
+from zoho_client import get_zoho_client
 from rate_limiter import zoho_rate_limiter
 from utils import (
     map_zoho_contact_to_interpreter,
     process_interpreter_import,
-    has_changes,
     get_changed_fields
 )
 
@@ -55,7 +54,8 @@ def run_sync(
     module: str,
     trigger_type: str,
     db: Session,
-    use_fully_onboarded: bool = True
+    use_fully_onboarded: bool = True,
+    bulk: bool = False
 ) -> SyncOperation:
     """
     Execute synchronization from Zoho CRM to Payment App
@@ -66,6 +66,8 @@ def run_sync(
         db: Database session
         use_fully_onboarded: If True, only sync records where LL_Onboarding_Status = "Fully Onboarded"
                             This ensures only completed onboarding records are synced
+        bulk: Fetch candidates through a Bulk Read job (minutes of polling, so
+              only for syncs that run in the background)
 
     Returns:
         SyncOperation record with results
@@ -105,9 +107,10 @@ def run_sync(
         # Combine criteria with AND
         criteria = "and".join(criteria_parts) if len(criteria_parts) > 1 else criteria_parts[0]
 
-        candidates = zoho_client.get_all_records(
+        candidates = get_zoho_client().get_all_records(
             module_name=module,
-            criteria=criteria
+            criteria=criteria,
+            bulk=bulk
         )
 
         sync_op.total_fetched = len(candidates)
@@ -188,7 +191,7 @@ def run_sync(
                     })
 
                 # Bulk update
-                response = zoho_client.bulk_update_records(module, update_data)
+                response = get_zoho_client().bulk_update_records(module, update_data)
 
                 # Check results
                 data = response.get("data", [])
@@ -308,7 +311,7 @@ def test_sync_single_record(
         if record_id:
             # Fetch by ID
             try:
-                response = zoho_client.get_records(module_name=module, page=1, per_page=1)
+                response = get_zoho_client().get_records(module_name=module, page=1, per_page=1)
                 records = response.get("data", [])
                 # Find the specific record by ID
                 for r in records:
@@ -319,7 +322,7 @@ def test_sync_single_record(
                 # If not found in first page, try direct search
                 if not record:
                     # Try to get all records and filter (for test mode this is acceptable)
-                    all_records = zoho_client.get_all_records(module_name=module, max_records=1000)
+                    all_records = get_zoho_client().get_all_records(module_name=module, max_records=1000)
                     for r in all_records:
                         if r.get("id") == record_id:
                             record = r
@@ -333,7 +336,7 @@ def test_sync_single_record(
             # Search by email
             try:
                 zoho_rate_limiter.wait_if_needed()
-                records = zoho_client.search_records(module_name=module, email=email)
+                records = get_zoho_client().search_records(module_name=module, email=email)
                 if records:
                     record = records[0]
             except Exception as e:
@@ -367,9 +370,8 @@ def test_sync_single_record(
 
         if existing:
             # Check for changes
-            from utils import has_changes, get_changed_fields
-            if has_changes(existing, interpreter_data):
-                changed_fields = get_changed_fields(existing, interpreter_data)
+            changed_fields = get_changed_fields(existing, interpreter_data)
+            if changed_fields:
                 result["changes_detected"] = list(changed_fields.keys())
 
                 # Update the record
@@ -402,7 +404,7 @@ def test_sync_single_record(
         if result["action_taken"] in ["created", "updated"]:
             try:
                 zoho_rate_limiter.wait_if_needed()
-                zoho_client.update_record(
+                get_zoho_client().update_record(
                     module_name=module,
                     record_id=record.get("id"),
                     data={"Sync_to_Payment_App": "Synced"}
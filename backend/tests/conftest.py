@@ -0,0 +1,73 @@
+"""
+Shared fakes for the Zoho client tests (HTTP layer is stubbed out)
+"""
+
+import json
+import pytest
+import requests
+from urllib.parse import parse_qsl
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, data=None, text="", status_code=200, headers=None):
+        self._data = data
+        self.text = text
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(response=self)
+
+    @property
+    def content(self):
+        return json.dumps(self._data).encode() if self._data is not None else b""
+
+    def json(self):
+        return self._data
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    """Records requests and answers them from a handler function
+
+    The handler returns either a FakeResponse or the JSON data to wrap in one.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        if kwargs.get("data") is not None:
+            # Bodies pre-serialized by the client arrive as bytes
+            kwargs["json"] = json.loads(kwargs.pop("data"))
+        if isinstance(kwargs.get("params"), str):
+            # Pre-encoded query strings are recorded as dicts too
+            kwargs["params"] = {k: int(v) if v.isdigit() else v for k, v in parse_qsl(kwargs["params"])}
+        self.calls.append((method, url, kwargs.get("params")))
+        response = self.handler(method, url, **kwargs)
+        return response if isinstance(response, FakeResponse) else FakeResponse(response)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_response():
+    """The FakeResponse class, for handlers that build their own responses"""
+    return FakeResponse
+
+
+@pytest.fixture
+def fake_session():
+    """The FakeSession class, for tests that extend it (e.g. with post())"""
+    return FakeSession
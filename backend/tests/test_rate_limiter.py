@@ -5,7 +5,7 @@ Unit tests for thread-safe rate limiter
 import pytest
 import time
 import threading
-from rate_limiter import RateLimiter
+from rate_limiter import RateLimiter, TokenBucket
 
 
 class TestRateLimiter:
@@ -155,3 +155,28 @@ class TestRateLimiter:
 
         # 3rd call fails again
         assert limiter.acquire() is not None
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket class"""
+
+    def test_burst_then_throttle(self):
+        """Test a full bucket allows a burst, then calls are spaced by the rate"""
+        bucket = TokenBucket(rate=20, capacity=3)
+
+        start = time.monotonic()
+        for _ in range(3):
+            bucket.acquire()
+        assert time.monotonic() - start < 0.05
+
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.04
+
+    def test_pause_blocks_all_acquirers(self):
+        """Test pause() holds back acquire() for the given time"""
+        bucket = TokenBucket(rate=100, capacity=10)
+        bucket.pause(0.2)
+
+        start = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.19
@@ -2,15 +2,40 @@
 Unit tests for utility functions
 """
 
+import io
+import gzip
 import pytest
+import requests
+from urllib3.response import HTTPResponse
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from models import Base, Interpreter
+import utils
 from utils import (
+    fetch_zoho_interpreter_csv,
     map_zoho_contact_to_interpreter,
+    process_interpreter_import,
     validate_import_data,
     has_changes,
     get_changed_fields
 )
 
 
+def make_stream_response(body: bytes, headers=None):
+    """Build a streamed requests.Response over a real urllib3 response"""
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = HTTPResponse(body=io.BytesIO(body), headers=headers, status=200, preload_content=False)
+    return response
+
+
+def make_session():
+    """Create an in-memory SQLite session with all tables"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine, autoflush=False)()
+
+
 class TestUtils:
     """Test suite for utility functions"""
 
@@ -218,3 +243,109 @@ class TestUtils:
         }
         result = map_zoho_contact_to_interpreter(record)
         assert result["contact_name"] == "Unknown"
+
+    def test_has_changes_treats_none_string_and_whitespace_as_equal(self):
+        """Test that "None"/blank values and surrounding whitespace are not changes"""
+        class MockInterpreter:
+            contact_name = "John Doe"
+            email = None
+            rate_per_minute = "None"
+
+        existing = MockInterpreter()
+        new_data = {
+            "contact_name": " John Doe ",
+            "email": "",
+            "rate_per_minute": ""
+        }
+
+        assert has_changes(existing, new_data) is False
+        assert get_changed_fields(existing, new_data) == {}
+
+    def test_process_import_matches_existing_by_record_id_and_email(self):
+        """Test import updates existing interpreters matched by record_id or email"""
+        db = make_session()
+        db.add_all([
+            Interpreter(id="1", record_id="zoho1", contact_name="John Doe", email="john@example.com"),
+            Interpreter(id="2", contact_name="Jane Smith", email="jane@example.com"),
+        ])
+        db.commit()
+
+        candidates = [
+            {"id": "zoho1", "Full_Name": "John Doe", "Email": "john@example.com"},
+            {"id": "zoho2", "Full_Name": "Jane Smith", "Email": "jane@example.com", "Language": "French"},
+            {"id": "zoho3", "Full_Name": "New Person", "Email": "new@example.com"},
+        ]
+
+        result = process_interpreter_import(candidates, db)
+        db.commit()
+
+        assert result["total"] == 3
+        assert [i.record_id for i in result["created"]] == ["zoho3"]
+        assert [i.id for i in result["updated"]] == ["2"]
+        assert result["updated"][0].record_id == "zoho2"
+        assert result["updated"][0].language == "French"
+        assert result["skipped"][0]["reason"] == "No changes detected"
+        assert db.query(Interpreter).count() == 3
+
+    def test_process_import_deduplicates_by_record_id(self):
+        """Test duplicate candidates for the same record keep the last occurrence"""
+        db = make_session()
+
+        candidates = [
+            {"id": "zoho1", "Full_Name": "John Doe", "Email": "john@example.com"},
+            {"id": "zoho1", "Full_Name": "John Doe", "Email": "john.doe@example.com"},
+        ]
+
+        result = process_interpreter_import(iter(candidates), db)
+        db.commit()
+
+        assert result["total"] == 2
+        assert len(result["created"]) == 1
+        assert result["created"][0].email == "john.doe@example.com"
+        assert db.query(Interpreter).count() == 1
+
+    def test_process_import_links_record_id_on_email_match(self):
+        """Test an email match with only a new record_id is stored as an update"""
+        db = make_session()
+        db.add(Interpreter(id="1", contact_name="John Doe", email="john@example.com"))
+        db.commit()
+
+        result = process_interpreter_import(
+            [{"id": "zoho1", "Full_Name": "John Doe", "Email": "john@example.com"}], db
+        )
+
+        assert len(result["updated"]) == 1
+        assert result["updated"][0].record_id == "zoho1"
+
+    def test_fetch_zoho_interpreter_csv_keeps_multiline_cells(self, monkeypatch):
+        """Test quoted cells spanning lines survive streaming and map by header"""
+        body = (
+            "Full Name,Email,Service Location,Rate/Hour\r\n"
+            "Jane Doe,jane@example.com,\"line one\r\nline two\",25\r\n"
+            "John Roe,john@example.com,Remote,30\r\n"
+        ).encode("utf-8")
+
+        monkeypatch.setattr(utils._http_session, "get", lambda url, **kw: make_stream_response(body))
+
+        rows = list(fetch_zoho_interpreter_csv("https://example.com/sheet.csv"))
+
+        assert [row["Email"] for row in rows] == ["jane@example.com", "john@example.com"]
+        assert rows[0]["Service_Location"] == "line one\r\nline two"
+        assert rows[0]["Rate_Hour"] == "25"
+        assert rows[1]["Language"] == ""
+
+    def test_fetch_zoho_interpreter_csv_reads_content_length_responses(self, monkeypatch):
+        """Test plain and gzipped responses with Content-Length are read to the end"""
+        body = "Full Name,Email\r\nJane Doe,jane@example.com\r\nJohn Roe,john@example.com\r\n".encode("utf-8")
+        compressed = gzip.compress(body)
+        responses = [
+            (body, {"Content-Length": str(len(body))}),
+            (compressed, {"Content-Length": str(len(compressed)), "Content-Encoding": "gzip"}),
+        ]
+
+        for payload, headers in responses:
+            monkeypatch.setattr(utils._http_session, "get", lambda url, **kw: make_stream_response(payload, headers))
+
+            rows = list(fetch_zoho_interpreter_csv("https://example.com/sheet.csv"))
+
+            assert [row["Email"] for row in rows] == ["jane@example.com", "john@example.com"]
@@ -0,0 +1,364 @@
+"""
+Unit tests for the Zoho Books client (HTTP layer is stubbed out)
+"""
+
+import json
+import pytest
+import requests
+import threading
+import time
+import zoho_books_client
+from zoho_books_client import ZohoBooksClient, get_zoho_books_client
+
+
+@pytest.fixture
+def make_client(fake_session):
+    """Factory for clients whose token refresh and HTTP session are stubbed"""
+    def make(handler):
+        client = ZohoBooksClient()
+        client.organization_id = "org1"
+        client._get_access_token = lambda: "token"
+        client.session = fake_session(handler)
+        return client
+    return make
+
+
+class TestZohoBooksClient:
+    """Test suite for ZohoBooksClient"""
+
+    def setup_method(self):
+        """Start each test without tokens shared by earlier clients"""
+        ZohoBooksClient._TOKEN_CACHE.clear()
+
+    def test_cacheable_get_is_served_from_cache(self, make_client):
+        """Test repeated cacheable GETs only hit the API once"""
+        client = make_client(lambda method, url, **kw: {"chartofaccounts": [{"account_id": "1"}]})
+
+        first = client.get_chart_of_accounts()
+        second = client.get_chart_of_accounts()
+
+        assert first == second == [{"account_id": "1"}]
+        assert len(client.session.calls) == 1
+
+    def test_write_invalidates_cached_resource(self, make_client):
+        """Test a POST to a resource drops its cached GET responses"""
+        client = make_client(lambda method, url, **kw: {"items": [], "item": {"item_id": "1"}})
+
+        client.search_items("Spanish")
+        client.create_item(name="Spanish", rate=1.0)
+        client.search_items("Spanish")
+
+        assert [call[0] for call in client.session.calls] == ["GET", "POST", "GET"]
+
+    def test_bust_cache_by_prefix(self, make_client):
+        """Test bust_cache only drops entries under the given prefix"""
+        client = make_client(lambda method, url, **kw: {"items": [], "contacts": []})
+
+        client.get_items()
+        client.get_contacts()
+        client.bust_cache("/books/v3/items")
+        client.get_items()
+        client.get_contacts()
+
+        assert len(client.session.calls) == 3
+
+    def test_concurrent_identical_gets_share_one_request(self, make_client):
+        """Test identical GETs in flight at the same time are coalesced"""
+        release = threading.Event()
+
+        def handler(method, url, **kw):
+            release.wait(timeout=5)
+            return {"bill": {"bill_id": "1"}}
+
+        client = make_client(handler)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(client.get_bill("1")))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.2)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert results == [{"bill_id": "1"}] * 5
+        assert len(client.session.calls) == 1
+
+    def test_get_expense_accounts_filters_type_search_and_limit(self, make_client):
+        """Test expense accounts are filtered by type and name, then limited"""
+        accounts = [
+            {"account_id": "1", "account_name": "Interpreter Fees", "account_type": "expense"},
+            {"account_id": "2", "account_name": "Sales", "account_type": "income"},
+            {"account_id": "3", "account_name": "Interpreter Travel", "account_type": "other_expense"},
+            {"account_id": "4", "account_name": "Rent", "account_type": "Lease_Expense"},
+        ]
+        client = make_client(lambda method, url, **kw: {"chartofaccounts": accounts})
+
+        assert [a["account_id"] for a in client.get_expense_accounts()] == ["1", "3", "4"]
+        assert [a["account_id"] for a in client.get_expense_accounts(search="interp")] == ["1", "3"]
+        assert [a["account_id"] for a in client.get_expense_accounts(search="interp", limit=1)] == ["1"]
+
+    def test_valid_token_is_reused_without_refresh(self, fake_session):
+        """Test a token that is not close to expiry is returned as-is"""
+        client = ZohoBooksClient()
+        client.session = fake_session(lambda method, url, **kw: pytest.fail("unexpected refresh"))
+        client.access_token = "cached-token"
+        client._token_expiry_monotonic = time.monotonic() + 3600
+
+        assert client._get_access_token() == "cached-token"
+        assert client._is_token_valid() is True
+
+    def test_create_bills_from_payments_resolves_each_vendor_once(self, make_client):
+        """Test a payment batch looks vendors up once per email and keeps order"""
+        def handler(method, url, **kw):
+            if method == "GET":
+                email = kw["params"]["email"]
+                return {"contacts": [{"contact_id": f"vendor-{email}"}]}
+            bill = kw["json"]["JSONString"]
+            return {"bill": {"bill_id": bill["reference_number"], "vendor_id": bill["vendor_id"]}}
+
+        client = make_client(handler)
+        payments = [
+            ({"contact_name": "A", "email": "a@example.com", "employee_id": "E1"}, {"total_hours": 2}),
+            ({"contact_name": "B", "email": "b@example.com", "employee_id": "E2"}, {"total_hours": 3}),
+            ({"contact_name": "A", "email": "a@example.com", "employee_id": "E3"}, {"total_hours": 4}),
+        ]
+
+        results = client.create_bills_from_payments(payments, default_account_id="acc1")
+
+        assert [r["bill"]["bill_id"] for r in results] == ["E1", "E2", "E3"]
+        assert results[2]["bill"]["vendor_id"] == "vendor-a@example.com"
+        assert sum(1 for call in client.session.calls if call[0] == "GET") == 2
+        assert sum(1 for call in client.session.calls if call[0] == "POST") == 3
+
+    def test_get_or_create_vendor_remembers_created_vendor(self, make_client):
+        """Test a vendor created for an email is reused without another lookup"""
+        def handler(method, url, **kw):
+            if method == "GET":
+                return {"contacts": []}
+            return {"contact": {"contact_id": "new-vendor"}}
+
+        client = make_client(handler)
+
+        first = client.get_or_create_vendor("Jane", email="Jane@Example.com")
+        second = client.get_or_create_vendor("Jane", email="jane@example.com")
+
+        assert first == second == {"contact_id": "new-vendor"}
+        assert [call[0] for call in client.session.calls] == ["GET", "POST"]
+
+    def test_token_refresh_schedules_prewarm_timer_cancelled_on_close(self, fake_session, fake_response):
+        """Test a refreshed token arms a daemon prewarm timer that close() cancels"""
+        class TokenSession(fake_session):
+            def post(self, url, **kwargs):
+                return fake_response({"access_token": "fresh", "expires_in": 3600})
+
+        client = ZohoBooksClient()
+        client._creds_ok = True
+        client.organization_id = None
+        client.session = TokenSession(lambda method, url, **kw: {})
+        client.start_background_tasks()
+
+        assert client._get_access_token() == "fresh"
+        timer = client._refresh_timer
+        assert timer is not None and timer.daemon and timer.is_alive()
+
+        client.close()
+        timer.join(timeout=1)
+        assert not timer.is_alive()
+        assert client._refresh_timer is None
+
+    def test_token_refresh_arms_no_timer_without_background_tasks(self, fake_session, fake_response):
+        """Test a client that was not started in the background refreshes on demand only"""
+        class TokenSession(fake_session):
+            def post(self, url, **kwargs):
+                return fake_response({"access_token": "fresh", "expires_in": 3600})
+
+        client = ZohoBooksClient()
+        client._creds_ok = True
+        client.session = TokenSession(lambda method, url, **kw: {})
+
+        assert client._get_access_token() == "fresh"
+        assert client._refresh_timer is None
+
+    def test_get_or_create_item_stops_paging_at_first_match(self, make_client):
+        """Test item pages are fetched lazily and paging stops at an exact match"""
+        pages = {
+            1: [{"item_id": "1", "name": "Spanish Court"}],
+            2: [{"item_id": "2", "name": "Spanish"}],
+            3: [{"item_id": "3", "name": "Spanish Medical"}],
+        }
+
+        def handler(method, url, **kw):
+            page = kw["params"]["page"]
+            assert kw["params"]["per_page"] == ZohoBooksClient.PAGE_SIZE
+            return {"items": pages[page], "page_context": {"has_more_page": page < 3}}
+
+        client = make_client(handler)
+
+        assert client.get_or_create_item("Spanish", rate=1.0) == {"item_id": "2", "name": "Spanish"}
+        assert [call[2]["page"] for call in client.session.calls] == [1, 2]
+        assert client.session.calls[0][2]["name"] == "Spanish"
+        assert "filter_by" not in client.session.calls[0][2]
+        assert [item["item_id"] for item in client.get_items()] == ["1", "2", "3"]
+
+    def test_get_or_create_item_returns_inactive_match_as_is(self, make_client):
+        """Test an inactive item with the name is returned without changing its status"""
+        client = make_client(
+            lambda method, url, **kw: {"items": [{"item_id": "7", "name": "Spanish", "status": "inactive"}]}
+        )
+
+        item = client.get_or_create_item("Spanish", rate=1.0)
+
+        assert item == {"item_id": "7", "name": "Spanish", "status": "inactive"}
+        assert [call[0] for call in client.session.calls] == ["GET"]
+
+    def test_get_or_create_item_lookup_is_not_cached(self, make_client):
+        """Test an item lookup that found nothing is not served from cache later"""
+        results = iter([[], [{"item_id": "9", "name": "Spanish"}]])
+
+        def handler(method, url, **kw):
+            if method == "POST":
+                return {"item": {"item_id": "8", "name": "Spanish"}}
+            return {"items": next(results)}
+
+        client = make_client(handler)
+        client.bust_cache = lambda prefix=None: None  # keep any cached pages across the create
+
+        assert client.get_or_create_item("Spanish", rate=1.0) == {"item_id": "8", "name": "Spanish"}
+        assert client.get_or_create_item("Spanish", rate=1.0) == {"item_id": "9", "name": "Spanish"}
+
+    def test_get_organizations_goes_through_make_request(self, make_client, fake_response):
+        """Test organizations are fetched on the pooled session with the usual error handling"""
+        client = make_client(lambda method, url, **kw: {"organizations": [{"organization_id": "org1"}]})
+
+        assert client.get_organizations() == [{"organization_id": "org1"}]
+        assert client.session.calls[0][:2] == ("GET", f"{client.api_base}/books/v3/organizations")
+
+        client.session.request = lambda method, url, **kw: fake_response({}, status_code=401)
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.get_organizations()
+
+    def test_missing_credentials_fail_fast_without_refresh(self, fake_session):
+        """Test a refresh is not attempted when credentials are missing"""
+        client = ZohoBooksClient()
+        client._creds_ok = False
+        client.session = fake_session(lambda method, url, **kw: pytest.fail("unexpected request"))
+
+        with pytest.raises(RuntimeError):
+            client._get_access_token()
+
+    def test_writes_without_parse_json_skip_decoding(self, make_client, fake_response):
+        """Test delete_bill returns {} without decoding the response body"""
+        class UndecodableResponse(fake_response):
+            content = property(lambda self: pytest.fail("body should not be decoded"))
+            json = content
+
+        client = make_client(lambda method, url, **kw: None)
+        client.session.request = lambda method, url, **kw: UndecodableResponse(None)
+
+        assert client.delete_bill("1") == {}
+
+    def test_item_status_writes_return_zoho_message(self, make_client):
+        """Test delete/mark item calls return Zoho's code and message for the API routes"""
+        body = {"code": 0, "message": "The item has been marked as inactive."}
+        client = make_client(lambda method, url, **kw: body)
+
+        assert client.mark_item_as_inactive("1") == body
+        assert client.mark_item_as_active("1") == body
+        assert client.delete_item("1") == body
+
+    def test_warmup_prefills_reference_data_cache(self, make_client):
+        """Test warmup caches accounts and vendors so later calls skip the API"""
+        client = make_client(lambda method, url, **kw: {"chartofaccounts": [], "contacts": []})
+
+        client._warmup()
+        client.get_chart_of_accounts()
+        client.get_contacts("vendor")
+
+        assert client._warmup_done.is_set()
+        assert len(client.session.calls) == 2
+
+    def test_get_or_create_vendor_does_not_create_on_lookup_error(self, make_client, fake_response):
+        """Test a failed vendor lookup is raised instead of creating a duplicate"""
+        client = make_client(lambda method, url, **kw: {})
+        client.session.request = lambda method, url, **kw: fake_response({}, status_code=401)
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.get_or_create_vendor("Jane", email="jane@example.com")
+
+    def test_get_contact_by_email_returns_none_on_404(self, make_client, fake_response):
+        """Test a 404 from the contact search is treated as not found"""
+        client = make_client(lambda method, url, **kw: {})
+        client.session.request = lambda method, url, **kw: fake_response({}, status_code=404)
+
+        assert client.get_contact_by_email("jane@example.com") is None
+
+    def test_contact_lookup_miss_is_not_cached(self, make_client):
+        """Test an email not found earlier is looked up again, not served from cache"""
+        results = iter([[], [{"contact_id": "created-elsewhere"}]])
+        client = make_client(lambda method, url, **kw: {"contacts": next(results)})
+
+        assert client.get_contact_by_email("jane@example.com") is None
+        assert client.get_contact_by_email("jane@example.com") == {"contact_id": "created-elsewhere"}
+        assert len(client.session.calls) == 2
+
+    def test_clients_with_same_credentials_share_a_token(self, fake_session, fake_response):
+        """Test a second client reuses the token the first one refreshed"""
+        refreshes = []
+
+        class TokenSession(fake_session):
+            def post(self, url, **kwargs):
+                refreshes.append(url)
+                return fake_response({"access_token": "shared", "expires_in": 3600})
+
+        first, second = ZohoBooksClient(), ZohoBooksClient()
+        for client in (first, second):
+            client._creds_ok = True
+            client.session = TokenSession(lambda method, url, **kw: {})
+
+        assert first._get_access_token() == "shared"
+        assert second._get_access_token() == "shared"
+        assert len(refreshes) == 1
+        assert first._token_lock is second._token_lock
+        first.close()
+
+    def test_json_payload_is_sent_as_serialized_body(self, make_client, fake_response):
+        """Test write payloads reach the session as a JSON body"""
+        sent = {}
+
+        def request(method, url, **kw):
+            sent.update(kw)
+            return fake_response({"bill": {"bill_id": "1"}})
+
+        client = make_client(lambda method, url, **kw: {})
+        client.session.request = request
+
+        client.update_bill("1", {"reference_number": "E1", "line_items": [{"rate": 1.5}]})
+
+        body = sent.get("data") or json.dumps(sent["json"]).encode()
+        assert json.loads(body) == {"JSONString": {"reference_number": "E1", "line_items": [{"rate": 1.5}]}}
+
+    def test_get_zoho_books_client_returns_one_shared_instance(self, monkeypatch):
+        """Test the lazy accessor builds the client once, reuses it and warms it once"""
+        started = []
+        monkeypatch.setattr(zoho_books_client, "_singleton", None)
+        monkeypatch.setattr(ZohoBooksClient, "start_background_tasks", lambda self: started.append(self))
+
+        client = get_zoho_books_client()
+
+        assert get_zoho_books_client() is client
+        assert started == [client]
+
+    def test_constructor_makes_no_api_calls(self, monkeypatch):
+        """Test a new client with credentials starts no warmup until asked to"""
+        for name in ("ZOHO_CLIENT_ID", "ZOHO_CLIENT_SECRET", "ZOHO_REFRESH_TOKEN", "ZOHO_BOOKS_ORGANIZATION_ID"):
+            monkeypatch.setenv(name, "x")
+        warmups = []
+        monkeypatch.setattr(ZohoBooksClient, "_warmup", lambda self: warmups.append(self))
+
+        client = ZohoBooksClient()
+        time.sleep(0.05)
+
+        assert client._creds_ok and warmups == []
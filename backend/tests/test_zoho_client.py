@@ -0,0 +1,428 @@
+"""
+Unit tests for the Zoho CRM client (HTTP layer is stubbed out)
+"""
+
+import io
+import json
+import logging
+import pytest
+import threading
+import time
+import zipfile
+from datetime import datetime, timedelta
+from urllib3.response import HTTPResponse
+from zoho_client import ZohoCRMClient, _RepeatFilter, get_zoho_client
+
+
+@pytest.fixture
+def make_client(fake_session):
+    """Factory for clients whose token refresh and HTTP session are stubbed"""
+    def make(handler):
+        client = ZohoCRMClient()
+        client._get_access_token = lambda: "token"
+        client.session = fake_session(handler)
+        # No field metadata for the default module: DEFAULT_FIELDS go out as-is
+        client._store_metadata(("fields", client.module_name), [])
+        return client
+    return make
+
+
+class TestZohoCRMClient:
+    """Test suite for ZohoCRMClient"""
+
+    def test_requests_go_through_pooled_session(self, make_client, fake_response):
+        """Test API calls are sent on the client's session with the auth header"""
+        seen = {}
+
+        def handler(method, url, **kw):
+            seen.update(kw["headers"])
+            return fake_response({"modules": [{"api_name": "Leads"}]})
+
+        client = make_client(handler)
+
+        assert client.get_modules() == [{"api_name": "Leads"}]
+        assert client.session.calls[0][:2] == ("GET", f"{client.api_base}/crm/v2/settings/modules")
+        assert seen["Authorization"] == "Zoho-oauthtoken token"
+
+    def test_get_all_records_follows_more_records(self, make_client, fake_response):
+        """Test pagination continues while Zoho reports more records"""
+        def handler(method, url, **kw):
+            page = kw["params"]["page"]
+            records = [{"id": str(page)}] * 200
+            return fake_response({"data": records, "info": {"more_records": page < 3}})
+
+        client = make_client(handler)
+
+        assert [r["id"] for r in client.get_all_records()[::200]] == ["1", "2", "3"]
+
+    def test_get_all_records_prefetches_within_max_records(self, make_client, fake_response):
+        """Test prefetching keeps page order and stops at max_records"""
+        def handler(method, url, **kw):
+            page = kw["params"]["page"]
+            records = [{"id": f"{page}-{i}"} for i in range(200)]
+            return fake_response({"data": records, "info": {"more_records": True}})
+
+        client = make_client(handler)
+
+        records = client.get_all_records(max_records=450)
+
+        assert len(records) == 450
+        assert records[0]["id"] == "1-0" and records[-1]["id"] == "3-49"
+        assert sorted(call[2]["page"] for call in client.session.calls) == [1, 2, 3]
+
+    def test_get_all_records_stops_on_empty_page(self, make_client, fake_response):
+        """Test a 204 (empty body) page past the end ends pagination"""
+        def handler(method, url, **kw):
+            page = kw["params"]["page"]
+            if page > 2:
+                return fake_response(text="")
+            return fake_response({"data": [{"id": str(page)}] * 200, "info": {"more_records": True}})
+
+        client = make_client(handler)
+
+        assert [r["id"] for r in client.get_all_records()[::200]] == ["1", "2"]
+
+    def test_get_all_records_stops_after_short_page(self, make_client, fake_response):
+        """Test a page with fewer than per_page records ends pagination"""
+        def handler(method, url, **kw):
+            page = kw["params"]["page"]
+            records = [{"id": str(page)}] * (200 if page == 1 else 5)
+            return fake_response({"data": records, "info": {"per_page": 200, "more_records": True}})
+
+        client = make_client(handler)
+
+        assert len(client.get_all_records()) == 205
+
+    def test_token_is_shared_through_cache_file(self, tmp_path, fake_session, fake_response):
+        """Test a refreshed token is written to the cache file and reused by a new client"""
+        refreshes = []
+
+        class TokenSession(fake_session):
+            def post(self, url, **kwargs):
+                refreshes.append(url)
+                return fake_response({"access_token": "fresh", "expires_in": 3600})
+
+        cache_path = str(tmp_path / "token.json")
+        first, second = ZohoCRMClient(), ZohoCRMClient()
+        for client in (first, second):
+            client._token_cache_path = cache_path
+            client.session = TokenSession(lambda method, url, **kw: None)
+
+        assert first._get_access_token() == "fresh"
+        assert second._get_access_token() == "fresh"
+        assert len(refreshes) == 1
+
+    def test_expiring_cached_token_is_refreshed(self, tmp_path, fake_session, fake_response):
+        """Test a cached token within 5 minutes of expiry is not reused"""
+        cache_path = tmp_path / "token.json"
+        expiry = datetime.now() + timedelta(minutes=2)
+        cache_path.write_text(json.dumps({"access_token": "stale", "expiry": expiry.isoformat()}))
+
+        class TokenSession(fake_session):
+            def post(self, url, **kwargs):
+                return fake_response({"access_token": "fresh", "expires_in": 3600})
+
+        client = ZohoCRMClient()
+        client._token_cache_path = str(cache_path)
+        client.session = TokenSession(lambda method, url, **kw: None)
+
+        assert client._get_access_token() == "fresh"
+        assert json.loads(cache_path.read_text())["access_token"] == "fresh"
+
+    def test_concurrent_token_requests_share_one_refresh(self, tmp_path, fake_session, fake_response):
+        """Test threads that find the token expired wait on a single refresh"""
+        refreshes = []
+        release = threading.Event()
+
+        class TokenSession(fake_session):
+            def post(self, url, **kwargs):
+                refreshes.append(url)
+                release.wait(timeout=5)
+                return fake_response({"access_token": "fresh", "expires_in": 3600})
+
+        client = ZohoCRMClient()
+        client._token_cache_path = str(tmp_path / "token.json")
+        client.session = TokenSession(lambda method, url, **kw: None)
+
+        tokens = []
+        threads = [threading.Thread(target=lambda: tokens.append(client._get_access_token())) for _ in range(5)]
+        for t in threads:
+            t.start()
+        time.sleep(0.2)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert tokens == ["fresh"] * 5
+        assert len(refreshes) == 1
+
+    def test_bulk_update_records_chunks_large_lists(self, make_client, fake_response):
+        """Test updates above the 100-record cap are chunked and merged in order"""
+        def handler(method, url, **kw):
+            return fake_response({"data": [{"details": {"id": r["id"]}} for r in kw["json"]["data"]]})
+
+        client = make_client(handler)
+        records = [{"id": str(i)} for i in range(201)]
+
+        response = client.bulk_update_records("Leads", records)
+
+        assert [item["details"]["id"] for item in response["data"]] == [r["id"] for r in records]
+        assert len(client.session.calls) == 3
+
+    def test_get_sheet_data_streams_csv_rows(self, make_client, fake_response):
+        """Test the sheet export is parsed from the raw stream, including quoted newlines"""
+        body = 'Name,Notes\nAna,"line one\nline two"\nLuis,\n'.encode("utf-8")
+        seen = {}
+
+        class StreamResponse(fake_response):
+            encoding = "utf-8"
+
+            def __init__(self):
+                super().__init__()
+                # A real urllib3 response with Content-Length closes itself at EOF
+                self.raw = HTTPResponse(
+                    body=io.BytesIO(body), headers={"Content-Length": str(len(body))},
+                    status=200, preload_content=False
+                )
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        def handler(method, url, **kw):
+            seen.update(kw)
+            return StreamResponse()
+
+        client = make_client(handler)
+
+        assert client.get_sheet_data() == [
+            {"Name": "Ana", "Notes": "line one\nline two"},
+            {"Name": "Luis", "Notes": ""},
+        ]
+        assert seen["timeout"] == ZohoCRMClient.REQUEST_TIMEOUT
+
+    def test_module_metadata_is_cached_until_invalidated(self, make_client, fake_response):
+        """Test module and field metadata is fetched once until invalidate_metadata()"""
+        client = make_client(lambda method, url, **kw: fake_response({"modules": [], "fields": [{"api_name": "Email"}]}))
+
+        client.get_modules()
+        client.get_modules()
+        assert client.get_module_fields("Leads") == [{"api_name": "Email"}]
+        client.get_module_fields("Leads")
+        client.get_module_fields("Contacts")
+        assert len(client.session.calls) == 3
+
+        client.invalidate_metadata()
+        client.get_modules()
+        assert len(client.session.calls) == 4
+
+    def test_update_body_is_sent_as_json(self, make_client, fake_response):
+        """Test update payloads reach the session as a JSON body"""
+        sent = {}
+
+        def request(method, url, **kw):
+            sent.update(kw)
+            return fake_response({"data": [{"code": "SUCCESS"}]})
+
+        client = make_client(lambda method, url, **kw: None)
+        client.session.request = request
+
+        client.update_record("Leads", "1", {"Status": "Synced"})
+
+        body = sent.get("data") or json.dumps(sent["json"]).encode()
+        assert json.loads(body) == {"data": [{"Status": "Synced"}]}
+
+    def test_get_all_records_requests_default_fields_the_module_has(self, make_client, fake_response):
+        """Test default fields are narrowed to the module's own fields before paging"""
+        def handler(method, url, **kw):
+            if url.endswith("/settings/fields"):
+                return fake_response({"fields": [{"api_name": "Email"}, {"api_name": "Country"}]})
+            return fake_response({"data": [{"id": "1"}], "info": {}})
+
+        client = make_client(handler)
+
+        client.get_all_records(module_name="Leads")
+
+        assert client.session.calls[-1][2]["fields"] == "Email,Country"
+
+    def test_get_all_records_sends_default_fields_string(self, make_client, fake_response):
+        """Test pages request DEFAULT_FIELDS (or the caller's list) as one comma-separated string"""
+        client = make_client(lambda method, url, **kw: fake_response({"data": [{"id": "1"}], "info": {}}))
+
+        client.get_all_records()
+        client.get_all_records(fields=["Email", "Language"])
+
+        assert client.session.calls[0][2]["fields"] == ",".join(ZohoCRMClient.DEFAULT_FIELDS)
+        assert client.session.calls[1][2]["fields"] == "Email,Language"
+
+    def test_bulk_read_downloads_zipped_csv(self, monkeypatch, make_client, fake_response):
+        """Test a bulk read job is created, polled and its zipped CSV parsed"""
+        monkeypatch.setattr(time, "sleep", lambda seconds: None)
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("123.csv", "Id,Email,Language\n1,a@example.com,Spanish\n2,,French\n")
+        states = iter(["IN PROGRESS", "COMPLETED"])
+        posted = {}
+
+        class ZipResponse(fake_response):
+            def iter_content(self, chunk_size):
+                yield archive.getvalue()
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        def handler(method, url, **kw):
+            if method == "POST":
+                posted.update(kw["json"]["query"])
+                return fake_response({"data": [{"details": {"id": "123"}}]})
+            if url.endswith("/settings/fields"):
+                return fake_response({"fields": [{"api_name": "Email"}, {"api_name": "Language"}]})
+            if url.endswith("/result"):
+                return ZipResponse()
+            return fake_response({"data": [{"state": next(states), "result": {"more_records": False}}]})
+
+        client = make_client(handler)
+
+        records = client.get_all_records(
+            module_name="Contacts",
+            criteria="(LL_Onboarding_Status:equals:Fully Onboarded)and(Language:equals:Spanish)",
+            bulk=True
+        )
+
+        assert records == [
+            {"id": "1", "Email": "a@example.com", "Language": "Spanish"},
+            {"id": "2", "Email": None, "Language": "French"},
+        ]
+        assert posted["fields"] == ["Email", "Language"]
+        assert posted["criteria"] == {"group_operator": "and", "group": [
+            {"api_name": "LL_Onboarding_Status", "comparator": "equal", "value": "Fully Onboarded"},
+            {"api_name": "Language", "comparator": "equal", "value": "Spanish"},
+        ]}
+
+    def test_bulk_read_failure_falls_back_to_pagination(self, make_client, fake_response):
+        """Test get_all_records pages through records when the bulk job cannot be created"""
+        def handler(method, url, **kw):
+            if method == "POST":
+                raise RuntimeError("bulk read scope missing")
+            return fake_response({"data": [{"id": "1"}], "info": {"more_records": False}})
+
+        client = make_client(handler)
+
+        assert client.get_all_records(bulk=True) == [{"id": "1"}]
+
+    def test_concurrent_identical_searches_share_one_request(self, make_client, fake_response):
+        """Test identical searches in flight together are coalesced and then cached"""
+        release = threading.Event()
+
+        def handler(method, url, **kw):
+            release.wait(timeout=5)
+            return fake_response({"data": [{"id": "1"}]})
+
+        client = make_client(handler)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(client.search_records(email="a@example.com")))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.2)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert results == [[{"id": "1"}]] * 5
+        assert client.search_records(email="a@example.com") == [{"id": "1"}]
+        assert len(client.session.calls) == 1
+
+    def test_write_clears_search_cache(self, make_client, fake_response):
+        """Test a record update makes the next search hit the API again"""
+        client = make_client(lambda method, url, **kw: fake_response({"data": [{"id": "1"}]}))
+
+        client.search_records(email="a@example.com")
+        client.update_record("Leads", "1", {"Status": "Synced"})
+        client.search_records(email="a@example.com")
+
+        assert [call[0] for call in client.session.calls] == ["GET", "PUT", "GET"]
+
+    def test_get_records_keeps_only_requested_keys(self, make_client, fake_response):
+        """Test keys= trims the parsed response to the requested top-level keys"""
+        client = make_client(lambda method, url, **kw: fake_response({"data": [], "info": {}, "extra": "x" * 100}))
+
+        assert client.get_records(keys=("data", "info")) == {"data": [], "info": {}}
+        assert "extra" in client.get_records()
+
+    def test_valid_token_is_reused_without_refresh(self, fake_session):
+        """Test a token before its monotonic refresh deadline is returned as-is"""
+        client = ZohoCRMClient()
+        client.session = fake_session(lambda method, url, **kw: pytest.fail("unexpected request"))
+        client.access_token = "cached-token"
+        client._token_expiry_monotonic = time.monotonic() + 3600
+
+        assert client._get_access_token() == "cached-token"
+        assert client._is_token_valid() is True
+
+    def test_queued_updates_are_sent_as_one_bulk_update(self, make_client, fake_response):
+        """Test queue_update batches records per module into bulk updates"""
+        def handler(method, url, **kw):
+            return fake_response({"data": [{"code": "SUCCESS"} for _ in kw["json"]["data"]]})
+
+        client = make_client(handler)
+
+        with client.batched_updates():
+            for i in range(5):
+                client.queue_update("Leads", str(i), {"Sync_to_Payment_App": "Synced"})
+            client.queue_update("Contacts", "c1", {"Sync_to_Payment_App": "Synced"})
+
+        puts = [call for call in client.session.calls if call[0] == "PUT"]
+        assert sorted(call[1].rsplit("/", 1)[1] for call in puts) == ["Contacts", "Leads"]
+
+    def test_failed_queued_update_is_retried(self, monkeypatch, make_client, fake_response):
+        """Test a failed batch is re-queued and sent again"""
+        monkeypatch.setattr(time, "sleep", lambda seconds: None)
+        attempts = []
+
+        def handler(method, url, **kw):
+            attempts.append(kw["json"]["data"])
+            if len(attempts) == 1:
+                raise RuntimeError("temporarily unavailable")
+            return fake_response({"data": [{"code": "SUCCESS"}]})
+
+        client = make_client(handler)
+        client.queue_update("Leads", "1", {"Status": "Synced"})
+        client.flush()
+
+        assert attempts == [[{"Status": "Synced", "id": "1"}]] * 2
+
+    def test_repeat_filter_drops_identical_messages_within_interval(self):
+        """Test the log filter passes a message once per interval and distinct messages always"""
+        log_filter = _RepeatFilter(interval=60)
+
+        def record(msg):
+            return logging.LogRecord("zoho_client", logging.WARNING, __file__, 1, msg, None, None)
+
+        assert log_filter.filter(record("Search failed with criteria=a")) is True
+        assert log_filter.filter(record("Search failed with criteria=a")) is False
+        assert log_filter.filter(record("Search failed with criteria=b")) is True
+
+    def test_rate_limited_request_waits_for_retry_after(self, monkeypatch, make_client, fake_response):
+        """Test a 429 pauses the client's rate limiter for Retry-After and is retried"""
+        throttled = fake_response({}, status_code=429, headers={"Retry-After": "2"})
+        responses = iter([throttled, fake_response({"modules": []})])
+        client = make_client(lambda method, url, **kw: next(responses))
+        pauses = []
+        monkeypatch.setattr(client._bucket, "pause", pauses.append)
+
+        assert client.get_modules() == []
+        assert len(client.session.calls) == 2
+        assert 2 <= pauses[0] <= 2.5
+        assert throttled.closed
+
+    def test_get_zoho_client_returns_one_shared_instance(self):
+        """Test the lazy accessor builds the client once and reuses it"""
+        assert get_zoho_client() is get_zoho_client()
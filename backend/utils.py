@@ -2,15 +2,54 @@
 Utility functions for Alfa Payment System
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable, Iterable, Iterator
 from sqlalchemy.orm import Session
 from datetime import datetime
+from functools import lru_cache
 import requests
+from requests.adapters import HTTPAdapter
+import sys
 import csv
 import io
 
 from models import Interpreter
 
+# Shared HTTP session so repeated sheet syncs reuse TCP/TLS connections
+_http_session = requests.Session()
+_http_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
+
+# Interpreter fields compared when deciding whether an import changes a record
+_COMPARED_FIELDS = (
+    'contact_name', 'last_name', 'email', 'employee_id',
+    'cloudbreak_id', 'languagelink_id', 'propio_id',
+    'language', 'country', 'payment_frequency', 'service_location',
+    'onboarding_status', 'rate_per_minute', 'rate_per_hour'
+)
+
+# get_changed_fields also carries the Zoho record_id over
+_CHANGED_FIELDS = _COMPARED_FIELDS + ('record_id',)
+
+# Loaded column values live in the instance __dict__; reading them there skips
+# the ORM attribute descriptor. Anything not loaded (expired, or a plain
+# object's class attribute) falls back to getattr.
+_NOT_LOADED = object()
+
+
+def _normalize(val) -> Optional[str]:
+    """Normalize None/""/"None" values to None and strip everything else"""
+    if val is None or val == "" or str(val).lower() == "none":
+        return None
+    return str(val).strip()
+
+
+def _values_equal(a, b) -> bool:
+    """Compare two field values the way has_changes/get_changed_fields do"""
+    # Fast path: identical objects or equal strings normalize identically
+    if a is b or (type(a) is str and type(b) is str and a == b):
+        return True
+    return _normalize(a) == _normalize(b)
+
 
 def has_changes(existing: Interpreter, new_data: Dict) -> bool:
     """
@@ -23,29 +62,14 @@ def has_changes(existing: Interpreter, new_data: Dict) -> bool:
     Returns:
         True if there are changes, False otherwise
     """
-    # List of fields to check for changes
-    fields_to_check = [
-        'contact_name', 'last_name', 'email', 'employee_id',
-        'cloudbreak_id', 'languagelink_id', 'propio_id',
-        'language', 'country', 'payment_frequency', 'service_location',
-        'onboarding_status', 'rate_per_minute', 'rate_per_hour'
-    ]
-
-    for field in fields_to_check:
-        new_value = new_data.get(field)
-        existing_value = getattr(existing, field, None)
+    loaded = vars(existing)
 
-        # Normalize None/""/empty values for comparison
-        def normalize(val):
-            if val is None or val == "" or str(val).lower() == "none":
-                return None
-            return str(val).strip()
+    for field in _COMPARED_FIELDS:
+        existing_value = loaded.get(field, _NOT_LOADED)
+        if existing_value is _NOT_LOADED:
+            existing_value = getattr(existing, field, None)
 
-        normalized_new = normalize(new_value)
-        normalized_existing = normalize(existing_value)
-
-        # If values differ, there's a change
-        if normalized_new != normalized_existing:
+        if not _values_equal(new_data.get(field), existing_value):
             return True
 
     return False
@@ -63,34 +87,100 @@ def get_changed_fields(existing: Interpreter, new_data: Dict) -> Dict[str, Any]:
         Dictionary containing only changed fields
     """
     changed = {}
+    loaded = vars(existing)
 
-    fields_to_check = [
-        'contact_name', 'last_name', 'email', 'employee_id',
-        'cloudbreak_id', 'languagelink_id', 'propio_id',
-        'language', 'country', 'payment_frequency', 'service_location',
-        'onboarding_status', 'rate_per_minute', 'rate_per_hour', 'record_id'
-    ]
-
-    for field in fields_to_check:
+    for field in _CHANGED_FIELDS:
         new_value = new_data.get(field)
-        existing_value = getattr(existing, field, None)
-
-        # Normalize None/""/empty values for comparison
-        def normalize(val):
-            if val is None or val == "" or str(val).lower() == "none":
-                return None
-            return str(val).strip() if val is not None else None
-
-        normalized_new = normalize(new_value)
-        normalized_existing = normalize(existing_value)
+        existing_value = loaded.get(field, _NOT_LOADED)
+        if existing_value is _NOT_LOADED:
+            existing_value = getattr(existing, field, None)
 
         # If values differ, include in changed fields (allow clearing with blank values)
-        if normalized_new != normalized_existing:
+        if not _values_equal(new_value, existing_value):
             changed[field] = new_value
 
     return changed
 
 
+# Zoho field(s) to read for each Interpreter field, in order of preference.
+# The first truthy value wins; if none is truthy the last lookup is used.
+_ZOHO_FIELD_MAP = (
+    ("record_id", ("id",)),
+    ("last_name", ("Last_Name",)),
+    ("email", ("Email",)),
+    ("employee_id", ("Emplyee_ID", "Emp_ID", "Employee_ID", "Interpreter_ID")),
+    ("cloudbreak_id", ("Cloudbreak_ID",)),
+    ("languagelink_id", ("Languagelink_ID", "LanguageLink_ID")),
+    ("propio_id", ("Propio_ID",)),
+    ("language", ("Language", "Native_Language")),
+    ("country", ("Mailing_Country", "Country")),
+    ("payment_frequency", ("Payment_Frequency",)),
+    ("onboarding_status", ("LL_Onboarding_Status",)),
+)
+
+_SERVICE_LOCATION_KEYS = ("Service_Location", "Work_Location", "Job_Scheduling")
+
+# Output keys of map_zoho_contact_to_interpreter, in the order its values are
+# built. Interned so every mapped dict shares the same key objects.
+_MAPPED_KEYS = tuple(
+    sys.intern(key) for key in (
+        *(dest for dest, _ in _ZOHO_FIELD_MAP),
+        "contact_name", "service_location", "rate_per_minute", "rate_per_hour"
+    )
+)
+
+
+def _clean_rate(value) -> str:
+    """Convert a rate to string, avoiding "None" strings"""
+    if value is None or value == "" or str(value).lower() == "none":
+        return ""
+    return str(value)
+
+
+def _first_value(candidate: Dict, keys: tuple):
+    """Return the first truthy value among keys (or the last lookup if none)"""
+    value = None
+    for key in keys:
+        value = candidate.get(key)
+        if value:
+            return value
+    return value
+
+
+def _build_zoho_mapper(field_map: tuple, service_location_keys: tuple) -> Callable[[Dict], Dict]:
+    """Build a Zoho Contact -> Interpreter mapping function for a field table"""
+    def mapper(candidate: Dict) -> Dict:
+        values = [_first_value(candidate, sources) for _, sources in field_map]
+        values.append(candidate.get("Full_Name") or "Unknown")
+        values.append(_first_value(candidate, service_location_keys) or "")
+        values.append(_clean_rate(candidate.get("Agreed_Rate")))
+        # From Rate/Hour column in spreadsheet
+        values.append(_clean_rate(candidate.get("Rate_Hour")))
+
+        return dict(zip(_MAPPED_KEYS, values))
+
+    return mapper
+
+
+_map_zoho_contact = _build_zoho_mapper(_ZOHO_FIELD_MAP, _SERVICE_LOCATION_KEYS)
+
+
+@lru_cache(maxsize=32)
+def _zoho_mapper_for_keys(present_keys: frozenset) -> Callable[[Dict], Dict]:
+    """
+    Build a mapper specialized for candidates that only carry present_keys
+
+    Fallback lookups for keys that are never present are dropped. The last
+    key of each chain is always kept so the "last lookup" result (None when
+    absent) is the same as with the generic mapper.
+    """
+    def trim(keys: tuple) -> tuple:
+        return tuple(key for key in keys[:-1] if key in present_keys) + keys[-1:]
+
+    field_map = tuple((dest, trim(sources)) for dest, sources in _ZOHO_FIELD_MAP)
+    return _build_zoho_mapper(field_map, trim(_SERVICE_LOCATION_KEYS))
+
+
 def map_zoho_contact_to_interpreter(candidate: Dict) -> Dict:
     """
     Map Zoho Contact fields to Interpreter model fields
@@ -101,43 +191,37 @@ def map_zoho_contact_to_interpreter(candidate: Dict) -> Dict:
     Returns:
         Dictionary with mapped interpreter data
     """
-    # Helper to convert rate to string, avoiding "None" strings
-    def clean_rate(value):
-        if value is None or value == "" or str(value).lower() == "none":
-            return ""
-        return str(value)
+    return _map_zoho_contact(candidate)
 
-    return {
-        "record_id": candidate.get("id"),
-        "contact_name": candidate.get("Full_Name") or "Unknown",
-        "last_name": candidate.get("Last_Name"),
-        "email": candidate.get("Email"),
-        "employee_id": (
-            candidate.get("Emplyee_ID") or
-            candidate.get("Emp_ID") or
-            candidate.get("Employee_ID") or
-            candidate.get("Interpreter_ID")
-        ),
-        "cloudbreak_id": candidate.get("Cloudbreak_ID"),
-        "languagelink_id": candidate.get("Languagelink_ID") or candidate.get("LanguageLink_ID"),
-        "propio_id": candidate.get("Propio_ID"),
-        "language": candidate.get("Language") or candidate.get("Native_Language"),
-        "country": candidate.get("Mailing_Country") or candidate.get("Country"),
-        "payment_frequency": candidate.get("Payment_Frequency"),
-        "service_location": (
-            candidate.get("Service_Location") or
-            candidate.get("Work_Location") or
-            candidate.get("Job_Scheduling") or
-            ""
-        ),
-        "onboarding_status": candidate.get("LL_Onboarding_Status"),
-        "rate_per_minute": clean_rate(candidate.get("Agreed_Rate")),
-        "rate_per_hour": clean_rate(candidate.get("Rate_Hour"))  # From Rate/Hour column in spreadsheet
-    }
+
+def _load_interpreter_lookups(db: Session) -> tuple:
+    """
+    Load all interpreters in one query and index them for import matching
+
+    Args:
+        db: Database session
+
+    Returns:
+        Tuple of (by_record_id, by_email, by_employee_id) dictionaries
+    """
+    by_record_id = {}
+    by_email = {}
+    by_employee_id = {}
+
+    for interpreter in db.query(Interpreter).all():
+        # Keep the first match per key, like the per-candidate .first() queries did
+        if interpreter.record_id:
+            by_record_id.setdefault(interpreter.record_id, interpreter)
+        if interpreter.email:
+            by_email.setdefault(interpreter.email, interpreter)
+        if interpreter.employee_id:
+            by_employee_id.setdefault(interpreter.employee_id, interpreter)
+
+    return by_record_id, by_email, by_employee_id
 
 
 def process_interpreter_import(
-    candidates: List[Dict],
+    candidates: Iterable[Dict],
     db: Session,
     update_existing: bool = True
 ) -> Dict:
@@ -145,64 +229,72 @@ def process_interpreter_import(
     Process import of interpreter candidates from Zoho
 
     Args:
-        candidates: List of candidate dictionaries
+        candidates: Candidate dictionaries (a list or a lazy iterator such as
+            fetch_zoho_interpreter_csv)
         db: Database session
         update_existing: Whether to update existing interpreters
 
     Returns:
         Dictionary with import results (created, updated, skipped, errors)
+        and the total number of candidates received (before de-duplication)
     """
     created = []
     updated = []
     skipped = []
     errors = []
 
+    # One timestamp per batch; id_counter keeps IDs unique within it
+    batch_ts = int(datetime.utcnow().timestamp() * 1000)
     id_counter = 0
 
+    # Collapse duplicate rows for the same record (common with paged
+    # exports) before any database work; the last occurrence wins
+    unique_candidates = {}
+    total = 0
     for candidate in candidates:
+        total += 1
+        key = candidate.get("id") or candidate.get("Email") or id(candidate)
+        unique_candidates[key] = candidate
+
+    # Load existing interpreters once instead of querying per candidate
+    by_record_id, by_email, by_employee_id = _load_interpreter_lookups(db)
+
+    # Specialize the field mapping to the keys this batch actually carries
+    present_keys = set()
+    for candidate in unique_candidates.values():
+        present_keys.update(candidate.keys())
+    map_candidate = _zoho_mapper_for_keys(frozenset(present_keys))
+
+    for candidate in unique_candidates.values():
         try:
             # Map Zoho fields to Interpreter fields
-            interpreter_data = map_zoho_contact_to_interpreter(candidate)
+            interpreter_data = map_candidate(candidate)
 
-            # Remove None values
+            # Remove None values (contact_name, the only required field,
+            # is always set: the mapper falls back to "Unknown")
             interpreter_data = {k: v for k, v in interpreter_data.items() if v is not None}
 
-            # Validate required fields
-            if not interpreter_data.get("contact_name"):
-                errors.append({
-                    "record_id": candidate.get("id"),
-                    "error": "Missing required field: contact_name"
-                })
-                continue
-
             # Check for existing interpreter by record_id, email, or employee_id
             existing = None
 
             # First try record_id (most reliable unique identifier)
             if interpreter_data.get("record_id"):
-                existing = db.query(Interpreter).filter(
-                    Interpreter.record_id == interpreter_data["record_id"]
-                ).first()
+                existing = by_record_id.get(interpreter_data["record_id"])
 
             # Fallback to email
             if not existing and interpreter_data.get("email"):
-                existing = db.query(Interpreter).filter(
-                    Interpreter.email == interpreter_data["email"]
-                ).first()
+                existing = by_email.get(interpreter_data["email"])
 
             # Fallback to employee_id
             if not existing and interpreter_data.get("employee_id"):
-                existing = db.query(Interpreter).filter(
-                    Interpreter.employee_id == interpreter_data["employee_id"]
-                ).first()
+                existing = by_employee_id.get(interpreter_data["employee_id"])
 
             if existing:
                 if update_existing:
-                    # Check if there are any changes
-                    if has_changes(existing, interpreter_data):
-                        # Get only changed fields
-                        changed_fields = get_changed_fields(existing, interpreter_data)
+                    # Get only changed fields (empty when nothing changed)
+                    changed_fields = get_changed_fields(existing, interpreter_data)
 
+                    if changed_fields:
                         # Update only changed fields
                         for key, value in changed_fields.items():
                             setattr(existing, key, value)
@@ -224,10 +316,9 @@ def process_interpreter_import(
             else:
                 # Create new interpreter with unique ID
                 new_interpreter = Interpreter(
-                    id=f"{int(datetime.utcnow().timestamp() * 1000)}_{id_counter}",
+                    id=f"{batch_ts}_{id_counter}",
                     **interpreter_data
                 )
-                db.add(new_interpreter)
                 created.append(new_interpreter)
                 id_counter += 1
 
@@ -238,14 +329,28 @@ def process_interpreter_import(
             })
             continue
 
+    # Register all new interpreters at once so the flush can batch the INSERTs
+    db.add_all(created)
+
     return {
         "created": created,
         "updated": updated,
         "skipped": skipped,
-        "errors": errors
+        "errors": errors,
+        "total": total
     }
 
 
+# (field, check, error message) rules for validate_import_data, applied in
+# order to every field that is present (not None)
+_IMPORT_VALIDATORS = (
+    ("max_records", lambda v: isinstance(v, int) and v >= 1, "max_records must be a positive integer"),
+    ("max_records", lambda v: v <= 1000, "max_records cannot exceed 1000"),
+    ("language", lambda v: isinstance(v, str), "language must be a string"),
+    ("service_location", lambda v: isinstance(v, str), "service_location must be a string"),
+)
+
+
 def validate_import_data(data: Dict) -> Optional[str]:
     """
     Validate import request data
@@ -256,72 +361,107 @@ def validate_import_data(data: Dict) -> Optional[str]:
     Returns:
         Error message if validation fails, None otherwise
     """
-    # Validate max_records if provided
-    max_records = data.get("max_records")
-    if max_records is not None:
-        if not isinstance(max_records, int) or max_records < 1:
-            return "max_records must be a positive integer"
-        if max_records > 1000:
-            return "max_records cannot exceed 1000"
-
-    # Validate language if provided
-    language = data.get("language")
-    if language is not None and not isinstance(language, str):
-        return "language must be a string"
-
-    # Validate service_location if provided
-    service_location = data.get("service_location")
-    if service_location is not None and not isinstance(service_location, str):
-        return "service_location must be a string"
+    for field, check, message in _IMPORT_VALIDATORS:
+        value = data.get(field)
+        if value is not None and not check(value):
+            return message
 
     return None
 
 
-def fetch_zoho_interpreter_csv(csv_url: str) -> List[Dict]:
+# Zoho CRM key and Zoho Sheet CSV column header for each exported field
+_CSV_COLUMNS = (
+    ("Email", "Email"),
+    ("Full_Name", "Full Name"),
+    ("Mailing_Country", "Mailing Country"),
+    ("id", "Record Id"),  # Zoho Record ID
+    ("Language", "Language"),
+    ("Payment_Frequency", "Payment frequency"),
+    ("Languagelink_ID", "Languagelink ID"),
+    ("Propio_ID", "Propio ID"),
+    ("Service_Location", "Service Location"),
+    ("Agreed_Rate", "Agreed Rate"),
+    ("Rate_Hour", "Rate/Hour"),  # Hourly rate from spreadsheet
+    ("Cloudbreak_ID", "Cloudbreak ID"),
+)
+
+
+def _resolve_csv_columns(header: List[str]) -> tuple:
+    """
+    Resolve the column index of each exported field from the CSV header
+
+    Args:
+        header: CSV header row
+
+    Returns:
+        Tuple of (Zoho CRM key, column index or None if the column is missing)
+    """
+    # Last occurrence wins for duplicated headers, as with csv.DictReader
+    positions = {name: index for index, name in enumerate(header)}
+    return tuple((key, positions.get(column)) for key, column in _CSV_COLUMNS)
+
+
+def _map_csv_row(row: List[str], columns: tuple) -> Optional[Dict]:
+    """
+    Map one Zoho Sheet CSV row to the Zoho CRM key format
+
+    Args:
+        row: CSV row values
+        columns: Column indices from _resolve_csv_columns
+
+    Returns:
+        Mapped dictionary, or None if the row has neither a name nor an email
+    """
+    width = len(row)
+    interpreter_data = {
+        key: row[index].strip() if index is not None and index < width else ""
+        for key, index in columns
+    }
+
+    if not (interpreter_data["Full_Name"] or interpreter_data["Email"]):
+        return None
+
+    return interpreter_data
+
+
+def fetch_zoho_interpreter_csv(csv_url: str) -> Iterator[Dict]:
     """
     Fetch and parse interpreter data from Zoho Sheet CSV URL
 
+    Rows are yielded as they are parsed, so the sheet is never held in memory
+    as a whole.
+
     Args:
         csv_url: The Zoho Sheet CSV download URL
 
-    Returns:
-        List of dictionaries containing interpreter data
+    Yields:
+        Dictionaries containing interpreter data (same keys as Zoho CRM format)
 
     Raises:
         Exception if fetch or parse fails
     """
     try:
-        # Fetch CSV from URL
-        response = requests.get(csv_url, timeout=30)
-        response.raise_for_status()
-
-        # Parse CSV
-        csv_content = response.content.decode('utf-8')
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
-
-        interpreters = []
-        for row in csv_reader:
-            # Map Zoho CSV fields to our format (using same keys as Zoho CRM format)
-            interpreter_data = {
-                "Email": row.get("Email", "").strip(),
-                "Full_Name": row.get("Full Name", "").strip(),
-                "Mailing_Country": row.get("Mailing Country", "").strip(),
-                "id": row.get("Record Id", "").strip(),  # Zoho Record ID
-                "Language": row.get("Language", "").strip(),
-                "Payment_Frequency": row.get("Payment frequency", "").strip(),
-                "Languagelink_ID": row.get("Languagelink ID", "").strip(),
-                "Propio_ID": row.get("Propio ID", "").strip(),
-                "Service_Location": row.get("Service Location", "").strip(),
-                "Agreed_Rate": row.get("Agreed Rate", "").strip(),
-                "Rate_Hour": row.get("Rate/Hour", "").strip(),  # Hourly rate from spreadsheet
-                "Cloudbreak_ID": row.get("Cloudbreak ID", "").strip(),
-            }
-
-            # Only add if we have at least a name or email
-            if interpreter_data.get("Full_Name") or interpreter_data.get("Email"):
-                interpreters.append(interpreter_data)
-
-        return interpreters
+        # Stream CSV from URL so rows are parsed while the body is still downloading
+        with _http_session.get(csv_url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+
+            # Read the raw stream rather than iter_lines(), which would split
+            # quoted cells that contain newlines
+            response.raw.decode_content = True
+            # urllib3 closes a Content-Length response at EOF by default,
+            # which makes TextIOWrapper's final read fail
+            response.raw.auto_close = False
+            csv_reader = csv.reader(io.TextIOWrapper(response.raw, encoding="utf-8", newline=""))
+
+            header = next(csv_reader, None)
+            if header is None:
+                return
+            columns = _resolve_csv_columns(header)
+
+            for row in csv_reader:
+                interpreter_data = _map_csv_row(row, columns)
+                if interpreter_data is not None:
+                    yield interpreter_data
 
     except requests.RequestException as e:
         raise Exception(f"Failed to fetch CSV from Zoho: {str(e)}")
@@ -1,13 +1,35 @@
 import os
+import json
+import hashlib
+import time
+import logging
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 import requests
-from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON encoding/decoding
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Chart of accounts types that can be used for bill (expense) line items
+_EXPENSE_ACCOUNT_TYPES = frozenset({
+    "expense", "manufacturing_expense", "impairment_expense",
+    "depreciation_expense", "employee_benefit_expense", "lease_expense",
+    "finance_expense", "tax_expense", "cost_of_goods_sold", "other_expense"
+})
+
 class ZohoBooksClient:
     """Client for interacting with Zoho Books API"""
 
@@ -30,6 +52,32 @@ class ZohoBooksClient:
         "CN": "https://accounts.zoho.com.cn"
     }
 
+    # Cache TTLs (seconds) for read-only GET endpoints; reference data such as
+    # the chart of accounts changes rarely
+    CACHE_TTLS = {
+        "/books/v3/chartofaccounts": 3600,
+        "/books/v3/items": 900,
+        "/books/v3/contacts": 300
+    }
+    CACHE_DEFAULT_TTL = 300
+    CACHE_MAX_ENTRIES = 512
+
+    # Refresh the access token in the background this many seconds before
+    # it expires, so no request has to wait on a synchronous refresh
+    TOKEN_PREWARM_SECONDS = 600
+
+    # Page size for paginated list endpoints (Zoho's maximum)
+    PAGE_SIZE = 200
+
+    # Access tokens shared by every client built from the same credentials:
+    # credential hash -> (token, monotonic refresh deadline)
+    _TOKEN_CACHE: Dict[str, Tuple[str, float]] = {}
+    # Guards _TOKEN_CACHE and _TOKEN_LOCKS
+    _class_token_lock = threading.Lock()
+    # One refresh lock per credential hash, so clients sharing credentials
+    # never refresh concurrently
+    _TOKEN_LOCKS: Dict[str, threading.Lock] = {}
+
     def __init__(self):
         self.client_id = os.getenv("ZOHO_CLIENT_ID")
         self.client_secret = os.getenv("ZOHO_CLIENT_SECRET")
@@ -39,86 +87,400 @@ class ZohoBooksClient:
 
         self.api_base = self.BOOKS_ENDPOINTS.get(self.region)
         self.auth_base = self.AUTH_ENDPOINTS.get(self.region)
+        self._token_url = f"{self.auth_base}/oauth/v2/token"
+
+        # Without all three credentials a token refresh can never succeed
+        self._creds_ok = bool(self.client_id and self.client_secret and self.refresh_token)
+
+        # Hashed so the credentials never show up in a dump of _TOKEN_CACHE
+        self._token_cache_key = hashlib.sha256(
+            f"{self.client_id}|{self.client_secret}|{self.refresh_token}|{self.region}".encode()
+        ).hexdigest()
 
         self.access_token = None
-        self.token_expiry = None
-        self._token_lock = threading.Lock()
+        # time.monotonic() deadline after which the token must be refreshed
+        # (already includes the 5 minute safety buffer)
+        self._token_expiry_monotonic = 0.0
+        with self._class_token_lock:
+            self._token_lock = self._TOKEN_LOCKS.setdefault(self._token_cache_key, threading.Lock())
+        # Daemon timer that refreshes the token ahead of expiry (only armed
+        # once start_background_tasks() has been called)
+        self._refresh_timer: Optional[threading.Timer] = None
+        self._closed = False
+
+        # Pooled session: keep-alive avoids a TCP+TLS handshake per API call
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # POST is not retried: creating bills/contacts is not idempotent
+                allowed_methods=["GET", "PUT", "DELETE"],
+                # Hand the last response back so raise_for_status() reports it
+                raise_on_status=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Accept-Encoding"] = "gzip, deflate"
+        self.session.headers["User-Agent"] = "AlfaPayment-ZohoBooksClient/1.0"
+
+        # Response cache for GETs: key -> (endpoint, expires_at, response)
+        self._cache: Dict[tuple, tuple] = {}
+        self._cache_lock = threading.Lock()
+
+        # GETs currently on the wire, so concurrent duplicates can share them
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Per-email locks used by get_or_create_vendor
+        self._vendor_locks: Dict[str, threading.Lock] = {}
+        self._vendor_locks_guard = threading.Lock()
 
         # Validate required credentials
-        if not all([self.client_id, self.client_secret, self.refresh_token]):
+        if not self._creds_ok:
             print("WARNING: Zoho Books credentials not fully configured")
         if not self.organization_id:
             print("WARNING: ZOHO_BOOKS_ORGANIZATION_ID not set. Get it from: https://books.zoho.com/app#/settings/organization")
 
+        # Set once start_background_tasks() has warmed the cache (or had
+        # nothing to warm); callers that need the warm cache can wait on it
+        self._warmup_done = threading.Event()
+        self._background_started = False
+
+    def start_background_tasks(self) -> None:
+        """
+        Warm the token and the reference-data cache in a background thread,
+        and from then on refresh the token ahead of expiry
+
+        Called for the shared client by get_zoho_books_client(), so the first
+        bill does not pay for them. Clients created by scripts and tests make
+        no API calls until they are used and refresh their token on demand,
+        so they hold no timer that needs close().
+        """
+        if self._background_started:
+            return
+        self._background_started = True
+        if self._creds_ok and self.organization_id:
+            threading.Thread(target=self._warmup, name="zoho-books-warmup", daemon=True).start()
+        else:
+            self._warmup_done.set()
+
+    def _warmup(self) -> None:
+        """Prefetch the chart of accounts and vendor list into the response cache"""
+        try:
+            self.get_chart_of_accounts()
+            self.get_contacts("vendor")
+        except Exception as e:
+            logger.warning(f"Zoho Books cache warmup failed: {e}")
+        finally:
+            self._warmup_done.set()
+
+    @staticmethod
+    def _token_usable(token: Optional[str], refresh_at: float) -> bool:
+        """Check a token/refresh-deadline snapshot"""
+        return bool(token) and time.monotonic() < refresh_at
+
     def _is_token_valid(self) -> bool:
         """Check if current access token is still valid"""
-        if not self.access_token or not self.token_expiry:
-            return False
-        # Add 5 minute buffer before expiry
-        return datetime.now() < (self.token_expiry - timedelta(minutes=5))
+        return self._token_usable(self.access_token, self._token_expiry_monotonic)
 
     def _get_access_token(self) -> str:
         """Get a new access token using refresh token (thread-safe)"""
-        # First check without lock (fast path)
-        if self._is_token_valid():
-            return self.access_token
+        # First check without lock (fast path). Read the shared token state
+        # into locals once so the token returned is the one that was checked.
+        token, refresh_at = self.access_token, self._token_expiry_monotonic
+        if self._token_usable(token, refresh_at):
+            return token
+
+        # Another client with the same credentials may hold a fresh token
+        token = self._adopt_shared_token()
+        if token:
+            return token
+
+        # Fail fast without queueing on the lock when a refresh cannot succeed
+        if not self._creds_ok:
+            raise RuntimeError(
+                "Zoho Books credentials not configured "
+                "(ZOHO_CLIENT_ID, ZOHO_CLIENT_SECRET, ZOHO_REFRESH_TOKEN)"
+            )
 
         # Need to refresh - acquire lock
         with self._token_lock:
             # Double-check after acquiring lock (another thread may have refreshed)
-            if self._is_token_valid():
-                return self.access_token
-
-            url = f"{self.auth_base}/oauth/v2/token"
-            params = {
-                "refresh_token": self.refresh_token,
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-                "grant_type": "refresh_token"
-            }
-
-            try:
-                response = requests.post(url, params=params)
-                response.raise_for_status()
-
-                data = response.json()
+            token, refresh_at = self.access_token, self._token_expiry_monotonic
+            if self._token_usable(token, refresh_at):
+                return token
 
-                if "access_token" not in data:
-                    raise Exception(f"No access_token in response: {data}")
+            token = self._adopt_shared_token()
+            if token:
+                return token
 
-                self.access_token = data["access_token"]
-                # Access tokens are valid for 1 hour
-                self.token_expiry = datetime.now() + timedelta(seconds=data.get("expires_in", 3600))
+            return self._refresh_access_token()
 
-                return self.access_token
-            except requests.exceptions.HTTPError as e:
-                error_msg = f"HTTP error during token refresh: {e.response.text if hasattr(e, 'response') else str(e)}"
-                raise Exception(error_msg)
-            except Exception as e:
-                raise Exception(f"Token refresh failed: {str(e)}")
-
-    def _make_request(self, method: str, endpoint: str, organization_id: Optional[str] = None, **kwargs) -> Dict:
-        """Make an authenticated request to Zoho Books API"""
-        access_token = self._get_access_token()
+    def _adopt_shared_token(self) -> Optional[str]:
+        """Copy a still-valid token from the class-level cache into this client"""
+        entry = self._TOKEN_CACHE.get(self._token_cache_key)
+        if entry is None or not self._token_usable(*entry):
+            return None
 
-        headers = kwargs.pop("headers", {})
-        headers["Authorization"] = f"Zoho-oauthtoken {access_token}"
+        token, refresh_at = entry
+        self._token_expiry_monotonic = refresh_at
+        self.access_token = token
+        return token
+
+    def _refresh_access_token(self) -> str:
+        """Exchange the refresh token for a new access token (caller holds _token_lock)"""
+        params = {
+            "refresh_token": self.refresh_token,
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "grant_type": "refresh_token"
+        }
 
+        try:
+            response = self.session.post(self._token_url, params=params)
+            response.raise_for_status()
+
+            data = response.json()
+
+            if "access_token" not in data:
+                raise Exception(f"No access_token in response: {data}")
+
+            token = data["access_token"]
+            expires_in = data.get("expires_in", 3600)
+            # Access tokens are valid for 1 hour; refresh 5 minutes early
+            refresh_at = time.monotonic() + expires_in - 300
+            self._token_expiry_monotonic = refresh_at
+            self.access_token = token
+            with self._class_token_lock:
+                self._TOKEN_CACHE[self._token_cache_key] = (token, refresh_at)
+
+            self._schedule_token_prewarm(expires_in - self.TOKEN_PREWARM_SECONDS)
+            return token
+        except requests.exceptions.HTTPError as e:
+            error_msg = f"HTTP error during token refresh: {e.response.text if hasattr(e, 'response') else str(e)}"
+            raise Exception(error_msg)
+        except Exception as e:
+            raise Exception(f"Token refresh failed: {str(e)}")
+
+    def _schedule_token_prewarm(self, delay: float, retry_delay: float = 30) -> None:
+        """(Re)start the background timer that refreshes the token after delay seconds"""
+        if self._closed or not self._background_started:
+            return
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        timer = threading.Timer(max(delay, 0), self._prewarm_token, kwargs={"retry_delay": retry_delay})
+        # Daemon so a pending refresh never keeps the process alive
+        timer.daemon = True
+        self._refresh_timer = timer
+        timer.start()
+
+    def _prewarm_token(self, retry_delay: float) -> None:
+        """Timer callback: refresh the token while the current one is still valid"""
+        if self._closed:
+            return
+        try:
+            with self._token_lock:
+                self._refresh_access_token()
+        except Exception as e:
+            # The current token is still usable; retry with backoff until it
+            # lapses, after which requests fall back to refreshing on demand
+            if time.monotonic() < self._token_expiry_monotonic:
+                logger.warning(f"Background Zoho Books token refresh failed, retrying in {retry_delay}s: {e}")
+                self._schedule_token_prewarm(retry_delay, retry_delay=min(retry_delay * 2, 300))
+            else:
+                logger.warning(f"Background Zoho Books token refresh failed: {e}")
+
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        organization_id: Optional[str] = None,
+        headers: Optional[Dict] = None,
+        cacheable: bool = False,
+        parse_json: bool = True
+    ) -> Dict:
+        """
+        Make an authenticated request to Zoho Books API
+
+        GET requests made with cacheable=True are served from an in-memory
+        TTL cache; any other method invalidates the cached entries of the
+        resource it writes to. Identical GETs issued concurrently share a
+        single HTTP call. Cached and shared responses are the same object
+        for every caller, so treat them as read-only. Writes made with
+        parse_json=False skip decoding the response body and return {}.
+        """
         # Add organization_id to params if not already present
         # Priority: explicit parameter > existing params > default from env
-        params = kwargs.get("params", {})
+        params = dict(params) if params else {}
         if "organization_id" not in params:
             org_id = organization_id or self.organization_id
             if org_id:
                 params["organization_id"] = org_id
-                kwargs["params"] = params
+
+        if method != "GET":
+            data = self._send(method, endpoint, params, json, headers, parse_json)
+            self.bust_cache(self._resource_prefix(endpoint))
+            return data
+
+        request_key = self._request_key(endpoint, params)
+
+        if cacheable:
+            cached = self._cache_get(request_key)
+            if cached is not None:
+                return cached
+
+        # Join an identical in-flight GET instead of issuing a duplicate
+        with self._inflight_lock:
+            future = self._inflight.get(request_key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[request_key] = Future()
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            data = self._send(method, endpoint, params, json, headers)
+            if cacheable:
+                self._cache_set(request_key, endpoint, data)
+            future.set_result(data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(request_key, None)
+
+    @staticmethod
+    def _request_key(endpoint: str, params: Dict) -> tuple:
+        """Cache/coalescing key of a GET request"""
+        return (endpoint, json.dumps(params, sort_keys=True, default=str))
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict,
+        json: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        parse_json: bool = True
+    ) -> Dict:
+        """Send a single authenticated HTTP request and decode the JSON body"""
+        access_token = self._get_access_token()
+
+        headers = dict(headers) if headers else {}
+        headers["Authorization"] = f"Zoho-oauthtoken {access_token}"
 
         url = f"{self.api_base}{endpoint}"
-        response = requests.request(method, url, headers=headers, **kwargs)
+        if json is not None and orjson is not None:
+            # Serialize JSONString payloads (bills with many line items) with
+            # orjson rather than letting requests use the stdlib encoder
+            headers["Content-Type"] = "application/json"
+            body = orjson.dumps(json, option=orjson.OPT_NON_STR_KEYS)
+            response = self.session.request(method, url, headers=headers, params=params, data=body)
+        else:
+            response = self.session.request(method, url, headers=headers, params=params, json=json)
         response.raise_for_status()
 
+        if not parse_json:
+            return {}
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()
 
+    # ============ RESPONSE CACHE ============
+
+    @staticmethod
+    def _resource_prefix(endpoint: str) -> str:
+        """Collection path of an endpoint, e.g. /books/v3/items/1/active -> /books/v3/items"""
+        return "/".join(endpoint.split("/")[:4])
+
+    def _cache_get(self, key: tuple) -> Optional[Dict]:
+        """Return a cached response if present and not expired"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._cache[key]
+                return None
+            return entry[2]
+
+    def _cache_set(self, key: tuple, endpoint: str, data: Dict):
+        """Store a response with the TTL configured for its endpoint"""
+        ttl = self.CACHE_TTLS.get(self._resource_prefix(endpoint), self.CACHE_DEFAULT_TTL)
+        now = time.monotonic()
+
+        with self._cache_lock:
+            if len(self._cache) >= self.CACHE_MAX_ENTRIES:
+                # Drop expired entries first, then the oldest ones
+                for stale_key in [k for k, v in self._cache.items() if v[1] <= now]:
+                    del self._cache[stale_key]
+                while len(self._cache) >= self.CACHE_MAX_ENTRIES:
+                    del self._cache[next(iter(self._cache))]
+
+            self._cache[key] = (endpoint, now + ttl, data)
+
+    def bust_cache(self, prefix: Optional[str] = None):
+        """
+        Invalidate cached responses
+
+        Args:
+            prefix: Only drop entries whose endpoint starts with this path
+                (e.g. "/books/v3/items"); drops everything if not provided
+        """
+        with self._cache_lock:
+            if prefix is None:
+                self._cache.clear()
+                return
+            for key in [k for k, v in self._cache.items() if v[0].startswith(prefix)]:
+                del self._cache[key]
+
+    def close(self):
+        """Cancel the token prewarm timer and close the pooled HTTP session"""
+        self._closed = True
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        self.session.close()
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        key: str,
+        params: Optional[Dict] = None,
+        organization_id: Optional[str] = None,
+        cacheable: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Yield the records of a paginated list endpoint one at a time
+
+        Pages are fetched lazily, PAGE_SIZE records at a time, until Zoho
+        reports page_context.has_more_page as false, so a caller that stops
+        iterating early never requests the remaining pages.
+        """
+        page = 1
+        while True:
+            page_params = dict(params or {}, page=page, per_page=self.PAGE_SIZE)
+            response = self._make_request(
+                "GET", endpoint, organization_id=organization_id,
+                params=page_params, cacheable=cacheable
+            )
+            yield from response.get(key, [])
+
+            if not response.get("page_context", {}).get("has_more_page"):
+                return
+            page += 1
+
     # ============ ORGANIZATION ============
 
     def get_organizations(self) -> List[Dict]:
@@ -129,28 +491,20 @@ class ZohoBooksClient:
         Returns:
             List of organization dictionaries with organization_id
         """
-        access_token = self._get_access_token()
-
-        headers = {"Authorization": f"Zoho-oauthtoken {access_token}"}
-        url = f"{self.api_base}/books/v3/organizations"
-
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-
-        data = response.json()
-        return data.get("organizations", [])
+        response = self._make_request("GET", "/books/v3/organizations")
+        return response.get("organizations", [])
 
     # ============ CHART OF ACCOUNTS ============
 
-    def get_chart_of_accounts(self, account_type: Optional[str] = None) -> List[Dict]:
+    def iter_chart_of_accounts(self, account_type: Optional[str] = None) -> Iterator[Dict]:
         """
-        Get chart of accounts
+        Iterate over the chart of accounts, fetching pages on demand
 
         Args:
             account_type: Filter by account type (e.g., 'expense', 'income', 'asset')
 
-        Returns:
-            List of account dictionaries
+        Yields:
+            Account dictionaries
         """
         endpoint = "/books/v3/chartofaccounts"
         params = {}
@@ -158,8 +512,19 @@ class ZohoBooksClient:
         if account_type:
             params["filter_by"] = f"AccountType.{account_type}"
 
-        response = self._make_request("GET", endpoint, params=params)
-        return response.get("chartofaccounts", [])
+        return self._iter_pages(endpoint, "chartofaccounts", params, cacheable=True)
+
+    def get_chart_of_accounts(self, account_type: Optional[str] = None) -> List[Dict]:
+        """
+        Get chart of accounts
+
+        Args:
+            account_type: Filter by account type (e.g., 'expense', 'income', 'asset')
+
+        Returns:
+            List of account dictionaries
+        """
+        return list(self.iter_chart_of_accounts(account_type))
 
     def get_expense_accounts(self, search: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
         """
@@ -172,34 +537,39 @@ class ZohoBooksClient:
         Returns:
             List of expense account dictionaries
         """
-        all_accounts = self.get_chart_of_accounts()
-        # Filter for expense-type accounts
-        expense_types = [
-            "expense", "manufacturing_expense", "impairment_expense",
-            "depreciation_expense", "employee_benefit_expense", "lease_expense",
-            "finance_expense", "tax_expense", "cost_of_goods_sold", "other_expense"
-        ]
-        expense_accounts = [
-            acc for acc in all_accounts
-            if acc.get("account_type", "").lower() in expense_types
-        ]
+        all_accounts = self.iter_chart_of_accounts()
+        search_lower = search.lower() if search else None
 
-        # Apply search filter if provided
-        if search:
-            search_lower = search.lower()
-            expense_accounts = [
-                acc for acc in expense_accounts
-                if search_lower in acc.get("account_name", "").lower()
-            ]
+        # Filter for expense-type accounts (and the search term) in one pass
+        expense_accounts = (
+            acc for acc in all_accounts
+            if acc.get("account_type", "").lower() in _EXPENSE_ACCOUNT_TYPES
+            and (search_lower is None or search_lower in acc.get("account_name", "").lower())
+        )
 
         # Apply limit if provided
         if limit:
-            expense_accounts = expense_accounts[:limit]
+            return list(islice(expense_accounts, limit))
 
-        return expense_accounts
+        return list(expense_accounts)
 
     # ============ CONTACTS (VENDORS) ============
 
+    def iter_contacts(self, contact_type: str = "vendor") -> Iterator[Dict]:
+        """
+        Iterate over contacts of a specific type, fetching pages on demand
+
+        Args:
+            contact_type: Type of contact ('vendor' or 'customer')
+
+        Yields:
+            Contact dictionaries
+        """
+        endpoint = "/books/v3/contacts"
+        params = {"contact_type": contact_type}
+
+        return self._iter_pages(endpoint, "contacts", params, cacheable=True)
+
     def get_contacts(self, contact_type: str = "vendor") -> List[Dict]:
         """
         Get all contacts of a specific type
@@ -210,11 +580,7 @@ class ZohoBooksClient:
         Returns:
             List of contact dictionaries
         """
-        endpoint = "/books/v3/contacts"
-        params = {"contact_type": contact_type}
-
-        response = self._make_request("GET", endpoint, params=params)
-        return response.get("contacts", [])
+        return list(self.iter_contacts(contact_type))
 
     def get_contact_by_email(self, email: str) -> Optional[Dict]:
         """
@@ -225,16 +591,27 @@ class ZohoBooksClient:
 
         Returns:
             Contact dictionary if found, None otherwise
+
+        Raises:
+            requests.HTTPError: For any failure other than 404, so callers
+                such as get_or_create_vendor never mistake an auth error or
+                rate limit for a missing contact and create a duplicate
         """
         endpoint = "/books/v3/contacts"
         params = {"email": email}
 
+        # Not cacheable: a cached miss would outlive a vendor created by another
+        # worker or in Books itself, and get_or_create_vendor would create a
+        # duplicate. Found vendors are remembered by get_or_create_vendor.
         try:
             response = self._make_request("GET", endpoint, params=params)
-            contacts = response.get("contacts", [])
-            return contacts[0] if contacts else None
-        except:
-            return None
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+
+        contacts = response.get("contacts", [])
+        return contacts[0] if contacts else None
 
     def create_vendor_contact(
         self,
@@ -321,18 +698,35 @@ class ZohoBooksClient:
         Returns:
             Vendor contact dictionary
         """
-        # Try to find existing vendor by email
-        if email:
-            existing = self.get_contact_by_email(email)
-            if existing:
-                return existing
-
-        # Create new vendor
-        return self.create_vendor_contact(
-            contact_name=contact_name,
-            email=email,
-            **kwargs
-        )
+        if not email:
+            # Nothing to look up by, create new vendor
+            return self.create_vendor_contact(contact_name=contact_name, **kwargs)
+
+        # Vendors resolved earlier (found or created) are remembered by email
+        cache_key = ("vendor", email.lower())
+        vendor = self._cache_get(cache_key)
+        if vendor is not None:
+            return vendor
+
+        # Serialize per email so concurrent callers cannot both create the vendor
+        with self._vendor_lock(cache_key[1]):
+            vendor = self._cache_get(cache_key)
+            if vendor is not None:
+                return vendor
+
+            # Try to find existing vendor by email, otherwise create it
+            vendor = self.get_contact_by_email(email) or self.create_vendor_contact(
+                contact_name=contact_name,
+                email=email,
+                **kwargs
+            )
+            self._cache_set(cache_key, "/books/v3/contacts", vendor)
+            return vendor
+
+    def _vendor_lock(self, email: str) -> threading.Lock:
+        """Lock guarding vendor lookup/creation for one email address"""
+        with self._vendor_locks_guard:
+            return self._vendor_locks.setdefault(email, threading.Lock())
 
     # ============ BILLS ============
 
@@ -373,14 +767,16 @@ class ZohoBooksClient:
         """
         endpoint = "/books/v3/bills"
 
+        # Read the clock once for both defaults
+        now = datetime.now()
+
         # Default date to today if not provided
         if not date:
-            date = datetime.now().strftime("%Y-%m-%d")
+            date = now.strftime("%Y-%m-%d")
 
         # Calculate due date if not provided
         if not due_date and payment_terms:
-            due_date_obj = datetime.now() + timedelta(days=payment_terms)
-            due_date = due_date_obj.strftime("%Y-%m-%d")
+            due_date = (now + timedelta(days=payment_terms)).strftime("%Y-%m-%d")
 
         data = {
             "vendor_id": vendor_id,
@@ -457,30 +853,41 @@ class ZohoBooksClient:
     def delete_bill(self, bill_id: str) -> Dict:
         """Delete a bill"""
         endpoint = f"/books/v3/bills/{bill_id}"
-        return self._make_request("DELETE", endpoint)
+        return self._make_request("DELETE", endpoint, parse_json=False)
 
     # ============ ITEMS ============
 
-    def get_items(
+    def iter_items(
         self,
         item_type: Optional[str] = None,
         status: Optional[str] = None,
-        organization_id: Optional[str] = None
-    ) -> List[Dict]:
+        organization_id: Optional[str] = None,
+        search_text: Optional[str] = None,
+        name: Optional[str] = None,
+        cacheable: bool = True
+    ) -> Iterator[Dict]:
         """
-        Get all items with optional filters
+        Iterate over items with optional filters, fetching pages on demand
 
         Args:
             item_type: Filter by type (sales, purchases, sales_and_purchases, inventory)
             status: Filter by status (active, inactive)
             organization_id: Zoho Books organization ID (uses env default if not provided)
+            search_text: Only items whose name or description contains this text
+            name: Only items with exactly this name
+            cacheable: Serve pages from the response cache (disable for
+                lookups that decide whether to create an item)
 
-        Returns:
-            List of item dictionaries
+        Yields:
+            Item dictionaries
         """
         endpoint = "/books/v3/items"
         params = {}
 
+        if search_text:
+            params["search_text"] = search_text
+        if name:
+            params["name"] = name
         if item_type:
             params["filter_by"] = f"ItemType.{item_type}"
         if status:
@@ -489,8 +896,26 @@ class ZohoBooksClient:
             if status_capitalized:
                 params["filter_by"] = f"Status.{status_capitalized}"
 
-        response = self._make_request("GET", endpoint, organization_id=organization_id, params=params)
-        return response.get("items", [])
+        return self._iter_pages(endpoint, "items", params, organization_id=organization_id, cacheable=cacheable)
+
+    def get_items(
+        self,
+        item_type: Optional[str] = None,
+        status: Optional[str] = None,
+        organization_id: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Get all items with optional filters
+
+        Args:
+            item_type: Filter by type (sales, purchases, sales_and_purchases, inventory)
+            status: Filter by status (active, inactive)
+            organization_id: Zoho Books organization ID (uses env default if not provided)
+
+        Returns:
+            List of item dictionaries
+        """
+        return list(self.iter_items(item_type, status, organization_id))
 
     def get_item(self, item_id: str) -> Dict:
         """Get a specific item by ID"""
@@ -598,11 +1023,7 @@ class ZohoBooksClient:
         Returns:
             List of matching items
         """
-        endpoint = "/books/v3/items"
-        params = {"search_text": search_text}
-
-        response = self._make_request("GET", endpoint, params=params)
-        return response.get("items", [])
+        return list(self.iter_items(search_text=search_text))
 
     def get_or_create_item(
         self,
@@ -621,9 +1042,15 @@ class ZohoBooksClient:
         Returns:
             Item dictionary
         """
-        # Try to find existing item by name
-        existing_items = self.search_items(name)
-        exact_match = next((item for item in existing_items if item.get("name") == name), None)
+        # Let Zoho filter to items with this exact name (active or not, as
+        # Books rejects a second item with the same name), then confirm the
+        # match locally, stopping at the first one. Not cacheable: a cached
+        # miss would outlive an item created by another worker and lead to a
+        # duplicate.
+        exact_match = next(
+            (item for item in self.iter_items(name=name, cacheable=False) if item.get("name") == name),
+            None
+        )
 
         if exact_match:
             return exact_match
@@ -653,13 +1080,98 @@ class ZohoBooksClient:
             Created bill dictionary
         """
         # Get or create vendor contact
-        vendor = self.get_or_create_vendor(
-            contact_name=interpreter_data.get("contact_name", "Unknown Interpreter"),
-            email=interpreter_data.get("email"),
-            phone=interpreter_data.get("phone"),
-            company_name=interpreter_data.get("company_name")
+        vendor = self.get_or_create_vendor(**self._payment_vendor_fields(interpreter_data))
+
+        # Create the bill
+        return self.create_bill(
+            vendor_id=vendor["contact_id"],
+            **self._payment_bill_fields(
+                interpreter_data, payment_data, default_account_id, auto_generate_bill_number
+            )
         )
 
+    def create_bills_from_payments(
+        self,
+        payments: List[Tuple[Dict, Dict]],
+        default_account_id: str,
+        auto_generate_bill_number: bool = True,
+        max_workers: int = 8
+    ) -> List[Dict]:
+        """
+        Create bills for many interpreter payments, running API calls in parallel
+
+        Vendors are resolved first, once per distinct interpreter (so a
+        batch never creates the same vendor twice), then all bills are
+        created concurrently.
+
+        Args:
+            payments: List of (interpreter_data, payment_data) tuples, in the
+                same format as create_bill_from_payment
+            default_account_id: Default expense account ID for line items
+            auto_generate_bill_number: Whether to auto-generate bill numbers
+            max_workers: Maximum number of concurrent API calls
+
+        Returns:
+            One result per payment, in input order:
+            {"success": True, "bill": {...}} or {"success": False, "error": "..."}
+        """
+        vendor_fields = [self._payment_vendor_fields(interpreter) for interpreter, _ in payments]
+
+        # One vendor lookup/creation per distinct interpreter
+        vendor_requests = {}
+        for fields in vendor_fields:
+            vendor_requests.setdefault(fields["email"] or fields["contact_name"], fields)
+
+        results: List[Optional[Dict]] = [None] * len(payments)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            vendor_futures = {
+                key: executor.submit(self.get_or_create_vendor, **fields)
+                for key, fields in vendor_requests.items()
+            }
+
+            bill_futures = {}
+            for index, ((interpreter, payment), fields) in enumerate(zip(payments, vendor_fields)):
+                try:
+                    vendor = vendor_futures[fields["email"] or fields["contact_name"]].result()
+                except Exception as e:
+                    results[index] = {"success": False, "error": f"Vendor lookup failed: {str(e)}"}
+                    continue
+
+                bill_futures[index] = executor.submit(
+                    self.create_bill,
+                    vendor_id=vendor["contact_id"],
+                    **self._payment_bill_fields(
+                        interpreter, payment, default_account_id, auto_generate_bill_number
+                    )
+                )
+
+            for index, future in bill_futures.items():
+                try:
+                    results[index] = {"success": True, "bill": future.result()}
+                except Exception as e:
+                    results[index] = {"success": False, "error": str(e)}
+
+        return results
+
+    @staticmethod
+    def _payment_vendor_fields(interpreter_data: Dict) -> Dict:
+        """Vendor fields (for get_or_create_vendor) of an interpreter payment"""
+        return {
+            "contact_name": interpreter_data.get("contact_name", "Unknown Interpreter"),
+            "email": interpreter_data.get("email"),
+            "phone": interpreter_data.get("phone"),
+            "company_name": interpreter_data.get("company_name")
+        }
+
+    @staticmethod
+    def _payment_bill_fields(
+        interpreter_data: Dict,
+        payment_data: Dict,
+        default_account_id: str,
+        auto_generate_bill_number: bool
+    ) -> Dict:
+        """Bill fields (for create_bill, minus vendor_id) of an interpreter payment"""
         # Build line items
         line_items = [{
             "name": f"Interpreter Services - {payment_data.get('language', 'Unknown')}",
@@ -677,15 +1189,27 @@ class ZohoBooksClient:
             period = payment_data.get("period", "")
             bill_number = f"BILL-{employee_id}-{period}".replace(" ", "-")
 
-        # Create the bill
-        return self.create_bill(
-            vendor_id=vendor["contact_id"],
-            line_items=line_items,
-            bill_number=bill_number,
-            reference_number=interpreter_data.get("employee_id"),
-            notes=f"Payment for interpreter services\nEmployee ID: {interpreter_data.get('employee_id', 'N/A')}"
-        )
+        return {
+            "line_items": line_items,
+            "bill_number": bill_number,
+            "reference_number": interpreter_data.get("employee_id"),
+            "notes": f"Payment for interpreter services\nEmployee ID: {interpreter_data.get('employee_id', 'N/A')}"
+        }
+
+
+# Singleton instance, created on first use so importing this module does not
+# read credentials, print warnings or start the warmup thread
+_singleton: Optional[ZohoBooksClient] = None
+_singleton_lock = threading.Lock()
 
 
-# Singleton instance
-zoho_books_client = ZohoBooksClient()
+def get_zoho_books_client() -> ZohoBooksClient:
+    """Return the shared ZohoBooksClient, creating and warming it on first call"""
+    global _singleton
+    if _singleton is None:
+        with _singleton_lock:
+            if _singleton is None:
+                client = ZohoBooksClient()
+                client.start_background_tasks()
+                _singleton = client
+    return _singleton
@@ -1,13 +1,78 @@
+import io
 import os
+import csv
+import time
+import random
+import queue
+import logging
+import hashlib
+import tempfile
+import zipfile
 import threading
+from contextlib import contextmanager
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlencode
 import requests
-from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import json
 from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from rate_limiter import TokenBucket
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON for large CRM pages and bulk updates
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; the token file is then unlocked
+    fcntl = None
+
+# .env is read when the first client is created rather than at import time;
+# deployments that already export the Zoho settings skip the file entirely
+_env_loaded = False
+
+
+def _load_env() -> None:
+    """Load environment variables from .env once, unless already set"""
+    global _env_loaded
+    if not _env_loaded:
+        if os.environ.get("ZOHO_CLIENT_ID") is None:
+            load_dotenv()
+        _env_loaded = True
+
+
+class _RepeatFilter(logging.Filter):
+    """Drop a log message identical to one emitted in the last `interval` seconds"""
+
+    def __init__(self, interval: float = 5.0, max_entries: int = 256):
+        super().__init__()
+        self.interval = interval
+        self.max_entries = max_entries
+        self._last_seen: "OrderedDict[tuple, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.levelno, record.getMessage())
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_seen.get(key)
+            if last is not None and now - last < self.interval:
+                return False
+            self._last_seen[key] = now
+            self._last_seen.move_to_end(key)
+            if len(self._last_seen) > self.max_entries:
+                self._last_seen.popitem(last=False)
+        return True
+
+
+logger = logging.getLogger(__name__)
+# Error paths such as a failing search can fire for every record in a batch
+logger.addFilter(_RepeatFilter())
 
 class ZohoCRMClient:
     """Client for interacting with Zoho CRM API"""
@@ -40,7 +105,64 @@ class ZohoCRMClient:
         "CN": "https://accounts.zoho.com.cn"
     }
 
+    # Pages get_all_records keeps in flight once it knows more pages exist
+    PREFETCH_PAGES = 6
+
+    # Self-throttle just under Zoho's 10 requests/second, and how often a
+    # request answered with 429 is retried after its Retry-After delay
+    REQUESTS_PER_SECOND = 9.5
+    RATE_LIMIT_RETRIES = 3
+
+    # Seconds to wait for a connection or for the next bytes of a response
+    REQUEST_TIMEOUT = 30
+
+    # Zoho CRM accepts at most 100 records per bulk update
+    BULK_UPDATE_LIMIT = 100
+
+    # Seconds module/field metadata is cached; the CRM schema rarely changes
+    METADATA_TTL = 600
+
+    # search_records results are reused briefly to absorb bursts of identical
+    # lookups (e.g. reconciling a batch by email)
+    SEARCH_CACHE_TTL = 30
+    SEARCH_CACHE_MAX_ENTRIES = 512
+
+    # queue_update batching: how long the writer waits to fill a batch, and
+    # how often a failed batch is retried (with exponential backoff)
+    WRITE_BATCH_WINDOW = 0.2
+    WRITE_MAX_ATTEMPTS = 5
+
+    # Fields get_all_records requests when the caller does not choose any:
+    # everything the import mapping (utils._ZOHO_FIELD_MAP, including its
+    # alternative names), the candidate filters and the import tab read.
+    # Each module has only some of them (Leads has Country, Contacts
+    # Mailing_Country), so the list is narrowed to the module's fields before
+    # it is sent. Without a fields list Zoho returns every column.
+    DEFAULT_FIELDS = (
+        "Full_Name", "First_Name", "Last_Name", "Contact_Name", "Email",
+        "Emplyee_ID", "Emp_ID", "Employee_ID", "Interpreter_ID",
+        "Cloudbreak_ID", "Languagelink_ID", "LanguageLink_ID", "Propio_ID",
+        "Language", "Native_Language", "Mailing_Country", "Country",
+        "Payment_Frequency", "LL_Onboarding_Status",
+        "Service_Location", "Work_Location", "Job_Scheduling",
+        "Agreed_Rate", "Rate_Hour", "Sync_to_Payment_App"
+    )
+
+    # Bulk Read job polling: first wait, cap for the doubling wait, and the
+    # longest a job may take before giving up (seconds)
+    BULK_READ_POLL_INTERVAL = 5
+    BULK_READ_MAX_POLL_INTERVAL = 60
+    BULK_READ_TIMEOUT = 1800
+
+    # Search comparators and their Bulk Read API equivalents
+    BULK_READ_COMPARATORS = {
+        "equals": "equal",
+        "not_equal": "not_equal",
+        "starts_with": "starts_with"
+    }
+
     def __init__(self):
+        _load_env()
         self.client_id = os.getenv("ZOHO_CLIENT_ID")
         self.client_secret = os.getenv("ZOHO_CLIENT_SECRET")
         self.refresh_token = os.getenv("ZOHO_REFRESH_TOKEN")
@@ -53,68 +175,268 @@ class ZohoCRMClient:
         self.auth_base = self.AUTH_ENDPOINTS.get(self.region)
 
         self.access_token = None
-        self.token_expiry = None
+        # time.monotonic() deadline after which the token must be refreshed
+        # (already includes the 5 minute safety buffer)
+        self._token_expiry_monotonic = 0.0
+        # Wall-clock expiry, only for sharing the token with other processes
+        self.token_expiry: Optional[datetime] = None
         self._token_lock = threading.Lock()
+        self._token_url = f"{self.auth_base}/oauth/v2/token"
+
+        # Module -> records endpoint, filled as modules are used
+        self._module_endpoints: Dict[str, str] = {self.module_name: f"/crm/v2/{self.module_name}"}
+        # Refresh in progress, shared by every thread waiting for a token
+        self._refresh_future: Optional[Future] = None
+
+        # Token file shared by every worker process and restart using the
+        # same credentials; the name is a hash so the secret is never exposed
+        cache_key = hashlib.sha256(f"{self.client_id}{self.refresh_token}".encode()).hexdigest()
+        self._token_cache_path = os.path.join(
+            os.getenv("ZOHO_TOKEN_CACHE_DIR", tempfile.gettempdir()),
+            f"zoho_token_{cache_key}.json"
+        )
+
+        # Pooled session shared by the CRM, Sheet and OAuth hosts: keep-alive
+        # avoids a TCP+TLS handshake on every page of a paginated fetch
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                # 429 is handled in _make_request so the pause is shared
+                # through the rate limiter by every thread
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=["GET", "PUT", "POST"],
+                # Hand the last response back so raise_for_status() reports it
+                raise_on_status=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Accept": "application/json"})
+
+        # search_records: results key -> (time.monotonic() expiry, records),
+        # plus the searches currently on the wire so duplicates can share them
+        self._search_cache: Dict[tuple, Tuple[float, List[Dict]]] = {}
+        self._search_inflight: Dict[tuple, Future] = {}
+        self._search_lock = threading.Lock()
+
+        # Updates queued by queue_update as (module, record, attempt); the
+        # writer thread that drains them starts on first use
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+
+        # Module/field metadata: key -> (time.monotonic() expiry, value)
+        self._metadata_cache: Dict[tuple, Tuple[float, List[Dict]]] = {}
+
+        # Shared by every thread using this client (prefetch workers, writer)
+        self._bucket = TokenBucket(rate=self.REQUESTS_PER_SECOND, capacity=10)
+
+        # Workers for prefetching record pages (threads start on first use)
+        self._executor = ThreadPoolExecutor(max_workers=self.PREFETCH_PAGES)
+
+    def close(self):
+        """Stop the prefetch workers and close the pooled HTTP session"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+    @staticmethod
+    def _token_usable(token: Optional[str], refresh_at: float) -> bool:
+        """Check a token/refresh-deadline snapshot"""
+        return bool(token) and time.monotonic() < refresh_at
 
     def _is_token_valid(self) -> bool:
         """Check if current access token is still valid"""
-        if not self.access_token or not self.token_expiry:
-            return False
-        # Add 5 minute buffer before expiry
-        return datetime.now() < (self.token_expiry - timedelta(minutes=5))
+        return self._token_usable(self.access_token, self._token_expiry_monotonic)
+
+    def _set_token(self, token: str, expires_in: float) -> None:
+        """Record a token valid for expires_in more seconds"""
+        # Refresh 5 minutes early
+        self._token_expiry_monotonic = time.monotonic() + expires_in - 300
+        self.token_expiry = datetime.now() + timedelta(seconds=expires_in)
+        self.access_token = token
 
     def _get_access_token(self) -> str:
         """Get a new access token using refresh token (thread-safe)"""
-        # First check without lock (fast path)
-        if self._is_token_valid():
-            return self.access_token
-
-        # Need to refresh - acquire lock
+        # Fast path: read the token state into locals once so the token
+        # returned is the one that was checked
+        token, refresh_at = self.access_token, self._token_expiry_monotonic
+        if self._token_usable(token, refresh_at):
+            return token
+
+        # Single flight: the first thread to see an expired token owns the
+        # refresh, every other thread waits on the same Future
         with self._token_lock:
-            # Double-check after acquiring lock (another thread may have refreshed)
-            if self._is_token_valid():
-                return self.access_token
-
-            url = f"{self.auth_base}/oauth/v2/token"
-            params = {
-                "refresh_token": self.refresh_token,
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-                "grant_type": "refresh_token"
-            }
+            token, refresh_at = self.access_token, self._token_expiry_monotonic
+            if self._token_usable(token, refresh_at):
+                return token
 
-            try:
-                response = requests.post(url, params=params)
-                response.raise_for_status()
+            future = self._refresh_future
+            is_owner = future is None or future.done()
+            if is_owner:
+                future = self._refresh_future = Future()
 
-                data = response.json()
+        if not is_owner:
+            return future.result(timeout=30)
 
-                if "access_token" not in data:
-                    raise Exception(f"No access_token in response: {data}")
+        try:
+            # Serialize refreshes across processes and reuse a token another
+            # process (or a previous run) already obtained
+            with self._token_file_lock():
+                if self._load_cached_token():
+                    token = self.access_token
+                else:
+                    token = self._refresh_access_token()
+                    self._store_cached_token()
+        except Exception as e:
+            future.set_exception(e)
+            raise
 
-                self.access_token = data["access_token"]
-                # Access tokens are valid for 1 hour
-                self.token_expiry = datetime.now() + timedelta(seconds=data.get("expires_in", 3600))
+        future.set_result(token)
+        return token
 
-                return self.access_token
-            except requests.exceptions.HTTPError as e:
-                error_msg = f"HTTP error during token refresh: {e.response.text if hasattr(e, 'response') else str(e)}"
-                raise Exception(error_msg)
-            except Exception as e:
-                raise Exception(f"Token refresh failed: {str(e)}")
+    def _refresh_access_token(self) -> str:
+        """Exchange the refresh token for a new access token"""
+        params = {
+            "refresh_token": self.refresh_token,
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "grant_type": "refresh_token"
+        }
+
+        try:
+            response = self.session.post(self._token_url, params=params)
+            response.raise_for_status()
+
+            data = response.json()
+
+            if "access_token" not in data:
+                raise Exception(f"No access_token in response: {data}")
+
+            # Access tokens are valid for 1 hour
+            self._set_token(data["access_token"], data.get("expires_in", 3600))
+
+            return self.access_token
+        except requests.exceptions.HTTPError as e:
+            error_msg = f"HTTP error during token refresh: {e.response.text if hasattr(e, 'response') else str(e)}"
+            raise Exception(error_msg)
+        except Exception as e:
+            raise Exception(f"Token refresh failed: {str(e)}")
+
+    @contextmanager
+    def _token_file_lock(self):
+        """Hold an exclusive lock on the shared token file (best effort)"""
+        try:
+            lock_file = open(f"{self._token_cache_path}.lock", "a")
+        except OSError:
+            yield
+            return
+
+        with lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            # Closing the file releases the lock
+            yield
+
+    def _load_cached_token(self) -> bool:
+        """Adopt the token from the shared token file if it is still valid"""
+        try:
+            with open(self._token_cache_path) as f:
+                cached = json.load(f)
+            token = cached["access_token"]
+            expiry = datetime.fromisoformat(cached["expiry"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
 
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict:
-        """Make an authenticated request to Zoho CRM API"""
+        expires_in = (expiry - datetime.now()).total_seconds()
+        if expires_in <= 300:
+            return False
+
+        self._set_token(token, expires_in)
+        return True
+
+    def _store_cached_token(self) -> None:
+        """Atomically write the current token to the shared token file"""
+        cache_dir = os.path.dirname(self._token_cache_path)
+        try:
+            # NamedTemporaryFile creates the file readable by the owner only
+            with tempfile.NamedTemporaryFile("w", dir=cache_dir, suffix=".tmp", delete=False) as f:
+                json.dump({"access_token": self.access_token, "expiry": self.token_expiry.isoformat()}, f)
+            os.replace(f.name, self._token_cache_path)
+        except OSError as e:
+            logger.warning("Could not write Zoho token cache: %s", e)
+
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        keys: Optional[Tuple[str, ...]] = None,
+        **kwargs
+    ) -> Dict:
+        """
+        Make an authenticated request to Zoho CRM API
+
+        With keys, only those top-level keys of the response are kept, so the
+        rest of a large page can be freed as soon as it is parsed.
+        """
         access_token = self._get_access_token()
 
         headers = kwargs.pop("headers", {})
         headers["Authorization"] = f"Zoho-oauthtoken {access_token}"
 
-        url = f"{self.api_base}{endpoint}"
-        response = requests.request(method, url, headers=headers, **kwargs)
+        if orjson is not None and kwargs.get("json") is not None:
+            # Encode bulk update bodies with orjson rather than the stdlib
+            headers["Content-Type"] = "application/json"
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"), option=orjson.OPT_NON_STR_KEYS)
+
+        response = self._send(method, f"{self.api_base}{endpoint}", headers, **kwargs)
+
+        # A write may change what a recent search would return
+        if method != "GET":
+            with self._search_lock:
+                self._search_cache.clear()
+
+        # Pages past the last one come back as 204 No Content
+        if not response.content:
+            return {}
+        data = orjson.loads(response.content) if orjson is not None else response.json()
+        if keys is not None:
+            return {key: data[key] for key in keys if key in data}
+        return data
+
+    def _send(self, method: str, url: str, headers: Dict, **kwargs) -> requests.Response:
+        """Send a request through the rate limiter, retrying 429 responses"""
+        kwargs.setdefault("timeout", self.REQUEST_TIMEOUT)
+        for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+            self._bucket.acquire()
+            response = self.session.request(method, url, headers=headers, **kwargs)
+            if response.status_code != 429 or attempt == self.RATE_LIMIT_RETRIES:
+                break
+            # Throttled: hold every thread back for Retry-After (plus jitter so
+            # waiting threads do not all fire at once), then try again. Close
+            # the discarded response so a streamed one frees its connection.
+            retry_after = self._retry_after(response)
+            response.close()
+            self._bucket.pause(retry_after + random.uniform(0, 0.5))
         response.raise_for_status()
+        return response
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float:
+        """Seconds to wait according to a 429 response (1 if not given in seconds)"""
+        try:
+            return max(float(response.headers.get("Retry-After", 1)), 0.0)
+        except ValueError:
+            return 1.0
 
-        return response.json()
+    def _module_endpoint(self, module: str) -> str:
+        """Records endpoint of a module, built once per module"""
+        endpoint = self._module_endpoints.get(module)
+        if endpoint is None:
+            endpoint = self._module_endpoints[module] = f"/crm/v2/{module}"
+        return endpoint
 
     def get_records(
         self,
@@ -122,7 +444,8 @@ class ZohoCRMClient:
         fields: Optional[str] = None,
         page: int = 1,
         per_page: int = 200,
-        criteria: Optional[str] = None
+        criteria: Optional[str] = None,
+        keys: Optional[Tuple[str, ...]] = None
     ) -> Dict:
         """
         Get records from a Zoho CRM module
@@ -133,12 +456,12 @@ class ZohoCRMClient:
             page: Page number (starts at 1)
             per_page: Number of records per page (max 200)
             criteria: COQL criteria for filtering (e.g., "(Status:equals:Active)")
+            keys: Top-level response keys to keep (None keeps the whole response)
 
         Returns:
             Dictionary containing records and metadata
         """
-        module = module_name or self.module_name
-        endpoint = f"/crm/v2/{module}"
+        endpoint = self._module_endpoint(module_name or self.module_name)
 
         params = {
             "page": page,
@@ -151,72 +474,285 @@ class ZohoCRMClient:
         if criteria:
             params["criteria"] = criteria
 
-        return self._make_request("GET", endpoint, params=params)
+        return self._make_request("GET", endpoint, keys=keys, params=params)
 
     def get_all_records(
         self,
         module_name: Optional[str] = None,
         fields: Optional[List[str]] = None,
         criteria: Optional[str] = None,
-        max_records: Optional[int] = None
+        max_records: Optional[int] = None,
+        bulk: bool = False
     ) -> List[Dict]:
         """
         Get all records from a module (handles pagination)
 
+        Once the first page reports more records, up to PREFETCH_PAGES later
+        pages are requested concurrently; records are still returned in
+        page order. A page shorter than per_page is taken as the last one.
+
         Args:
             module_name: Name of the module
-            fields: List of field API names to retrieve
+            fields: Field API names to retrieve, as a list or comma-separated
+                string (defaults to the DEFAULT_FIELDS the module has)
             criteria: COQL criteria for filtering
             max_records: Maximum number of records to retrieve (None for all)
+            bulk: Fetch through a Bulk Read job (one CSV download instead of a
+                request per 200 records); falls back to pagination if the job
+                cannot be run, e.g. without the bulk read scope or quota
 
         Returns:
             List of all records
         """
-        all_records = []
-        page = 1
+        if bulk:
+            try:
+                records = self.bulk_read(module_name=module_name, fields=fields, criteria=criteria)
+                return records[:max_records] if max_records else records
+            except Exception as e:
+                logger.warning("Bulk read failed, falling back to pagination: %s", e)
 
-        while True:
-            response = self.get_records(
-                module_name=module_name,
-                fields=fields,
-                page=page,
-                criteria=criteria
+        module = module_name or self.module_name
+
+        # Encode the query once; only the page number changes between pages
+        endpoint = self._module_endpoint(module)
+        per_page = 200
+        query = {
+            "per_page": per_page,
+            "fields": ",".join(self._resolve_fields(module, fields))
+        }
+        if criteria:
+            query["criteria"] = criteria
+        base_query = urlencode(query)
+
+        def fetch(page: int) -> Dict:
+            # Pagination only needs the records and the paging info
+            return self._make_request(
+                "GET", endpoint, keys=("data", "info"), params=f"page={page}&{base_query}"
             )
 
-            records = response.get("data", [])
-            if not records:
-                break
+        # Fetch the first page on its own: it tells us whether there is more
+        # and makes sure the access token is in place before workers start
+        pages = deque()
+        next_page = 1
+        all_records = []
+        response = fetch(next_page)
+        next_page += 1
 
-            all_records.extend(records)
+        # Never prefetch beyond the pages max_records can use
+        last_page = -(-max_records // per_page) if max_records else None
 
-            # Check if we've reached max_records
-            if max_records and len(all_records) >= max_records:
-                all_records = all_records[:max_records]
-                break
+        try:
+            while True:
+                records = response.get("data", [])
+                if not records:
+                    break
+
+                all_records.extend(records)
+
+                # Check if we've reached max_records
+                if max_records and len(all_records) >= max_records:
+                    all_records = all_records[:max_records]
+                    break
+
+                # Check if there are more pages. Zoho's info["count"] is the
+                # size of this page, not the total, so a short page is the
+                # only early sign of the end; stop there rather than waiting
+                # on (or requesting) pages past it
+                info = response.get("info", {})
+                if not info.get("more_records", False) or len(records) < info.get("per_page", per_page):
+                    break
+
+                # Keep a window of later pages in flight while this one is consumed
+                while len(pages) < self.PREFETCH_PAGES and (last_page is None or next_page <= last_page):
+                    pages.append(self._executor.submit(fetch, next_page))
+                    next_page += 1
+
+                if not pages:
+                    break
+                response = pages.popleft().result()
+        finally:
+            # Early exit: drop prefetched pages that are no longer needed
+            for future in pages:
+                future.cancel()
 
-            # Check if there are more pages
-            info = response.get("info", {})
-            if not info.get("more_records", False):
-                break
+        return all_records
+
+    def bulk_read(
+        self,
+        module_name: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        criteria: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Read records with the Zoho Bulk Read API
+
+        Submits a bulk read job, waits for it to complete and downloads the
+        zipped CSV result (up to 200,000 records per job, with further jobs
+        for later pages). Values are returned as strings, as in the CSV, and
+        empty cells as None, as pagination returns them.
+
+        Args:
+            module_name: Name of the module
+            fields: Field API names to retrieve (defaults to DEFAULT_FIELDS)
+            criteria: Search criteria such as "(Language:equals:Spanish)and(...)"
+
+        Returns:
+            List of records, with the record ID under "id"
+        """
+        module = module_name or self.module_name
+        query = {
+            "module": module,
+            "fields": self._resolve_fields(module, fields)
+        }
+        if criteria:
+            query["criteria"] = self._bulk_read_criteria(criteria)
 
+        records = []
+        page = 1
+        while True:
+            query["page"] = page
+            response = self._make_request("POST", "/crm/bulk/v2/read", json={"query": query})
+            job_id = response["data"][0]["details"]["id"]
+
+            result = self._wait_for_bulk_read(job_id)
+            records.extend(self._download_bulk_read(job_id))
+
+            if not result.get("more_records"):
+                return records
             page += 1
 
-        return all_records
+    def _resolve_fields(self, module: str, fields=None) -> List[str]:
+        """
+        Field API names to request from a module, shared by pagination and
+        bulk reads so both return the same keys
+
+        The caller's fields (a list or comma-separated string) are used as
+        given; by default DEFAULT_FIELDS is narrowed to the fields the module
+        has (all of them if its metadata cannot be read).
+        """
+        if isinstance(fields, str):
+            return fields.split(",")
+        if fields is not None:
+            return list(fields)
+
+        try:
+            api_names = {field.get("api_name") for field in self.get_module_fields(module)}
+        except Exception:
+            logger.warning("Could not read fields of %s; requesting defaults as-is", module, exc_info=True)
+            return list(self.DEFAULT_FIELDS)
+        if not api_names:
+            return list(self.DEFAULT_FIELDS)
+        return [field for field in self.DEFAULT_FIELDS if field in api_names]
+
+    def _bulk_read_criteria(self, criteria: str) -> Dict:
+        """Translate "(Field:comparator:value)and(...)" criteria to a Bulk Read criteria object"""
+        criteria = criteria.strip()
+        if not (criteria.startswith("(") and criteria.endswith(")")) or ")or(" in criteria:
+            raise ValueError(f"Unsupported criteria for bulk read: {criteria}")
+
+        conditions = []
+        for part in criteria[1:-1].split(")and("):
+            api_name, comparator, value = part.split(":", 2)
+            if comparator not in self.BULK_READ_COMPARATORS:
+                raise ValueError(f"Unsupported comparator for bulk read: {comparator}")
+            conditions.append({
+                "api_name": api_name,
+                "comparator": self.BULK_READ_COMPARATORS[comparator],
+                "value": value
+            })
+
+        if len(conditions) == 1:
+            return conditions[0]
+        return {"group_operator": "and", "group": conditions}
+
+    def _wait_for_bulk_read(self, job_id: str) -> Dict:
+        """Poll a bulk read job with exponential backoff until it completes"""
+        interval = self.BULK_READ_POLL_INTERVAL
+        deadline = time.monotonic() + self.BULK_READ_TIMEOUT
+
+        while True:
+            response = self._make_request("GET", f"/crm/bulk/v2/read/{job_id}")
+            job = response["data"][0]
+            state = job.get("state")
+
+            if state == "COMPLETED":
+                return job.get("result", {})
+            if state == "FAILURE":
+                raise Exception(f"Bulk read job {job_id} failed: {job}")
+            if time.monotonic() + interval > deadline:
+                raise Exception(f"Bulk read job {job_id} did not complete within {self.BULK_READ_TIMEOUT}s")
+
+            time.sleep(interval)
+            interval = min(interval * 2, self.BULK_READ_MAX_POLL_INTERVAL)
+
+    def _download_bulk_read(self, job_id: str) -> List[Dict]:
+        """Download a completed bulk read job and parse its zipped CSV"""
+        url = f"{self.api_base}/crm/bulk/v2/read/{job_id}/result"
+        headers = {
+            "Authorization": f"Zoho-oauthtoken {self._get_access_token()}",
+            # The result is a zip file, not the session's default JSON
+            "Accept": "*/*"
+        }
+
+        with self._send("GET", url, headers, stream=True) as response:
+            # Spool the archive (zipfile needs to seek); large results go to disk
+            with tempfile.SpooledTemporaryFile(max_size=32 * 1024 * 1024) as archive_file:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    archive_file.write(chunk)
+                archive_file.seek(0)
+
+                with zipfile.ZipFile(archive_file) as archive:
+                    with archive.open(archive.namelist()[0]) as member:
+                        reader = csv.DictReader(io.TextIOWrapper(member, encoding="utf-8", newline=""))
+                        records = []
+                        for row in reader:
+                            # Match paginated records: empty cells are None,
+                            # and the record ID column "Id" becomes "id"
+                            record = {key: value if value != "" else None for key, value in row.items()}
+                            if "Id" in record:
+                                record["id"] = record.pop("Id")
+                            records.append(record)
+
+        return records
+
+    def _cached_metadata(self, key: tuple) -> Optional[List[Dict]]:
+        """Return cached metadata for key if it has not expired"""
+        expiry, value = self._metadata_cache.get(key, (0.0, None))
+        return value if time.monotonic() < expiry else None
+
+    def _store_metadata(self, key: tuple, value: List[Dict]) -> List[Dict]:
+        """Cache metadata for METADATA_TTL seconds and return it"""
+        self._metadata_cache[key] = (time.monotonic() + self.METADATA_TTL, value)
+        return value
+
+    def invalidate_metadata(self) -> None:
+        """Drop cached module and field metadata (e.g. after a CRM schema change)"""
+        self._metadata_cache.clear()
 
     def get_modules(self) -> List[Dict]:
-        """Get all available modules"""
+        """Get all available modules (cached for METADATA_TTL seconds)"""
+        key = ("modules",)
+        cached = self._cached_metadata(key)
+        if cached is not None:
+            return cached
+
         endpoint = "/crm/v2/settings/modules"
         response = self._make_request("GET", endpoint)
-        return response.get("modules", [])
+        return self._store_metadata(key, response.get("modules", []))
 
     def get_module_fields(self, module_name: Optional[str] = None) -> List[Dict]:
-        """Get field metadata for a module"""
+        """Get field metadata for a module (cached for METADATA_TTL seconds)"""
         module = module_name or self.module_name
+        key = ("fields", module)
+        cached = self._cached_metadata(key)
+        if cached is not None:
+            return cached
+
         endpoint = f"/crm/v2/settings/fields"
         params = {"module": module}
 
         response = self._make_request("GET", endpoint, params=params)
-        return response.get("fields", [])
+        return self._store_metadata(key, response.get("fields", []))
 
     def search_records(
         self,
@@ -240,8 +776,59 @@ class ZohoCRMClient:
 
         Returns:
             List of matching records
+
+        Identical searches made at the same time share one request, and
+        results are reused for SEARCH_CACHE_TTL seconds (until the next write).
+        The returned list may be shared between callers, so treat it as
+        read-only.
         """
         module = module_name or self.module_name
+        key = (module, criteria, email, phone, word, per_page)
+
+        with self._search_lock:
+            expiry, records = self._search_cache.get(key, (0.0, None))
+            if records is not None and time.monotonic() < expiry:
+                return records
+
+            future = self._search_inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._search_inflight[key] = Future()
+
+        try:
+            if not is_owner:
+                return future.result()
+
+            try:
+                records = self._search(module, criteria, email, phone, word, per_page)
+                with self._search_lock:
+                    if len(self._search_cache) >= self.SEARCH_CACHE_MAX_ENTRIES:
+                        self._search_cache.clear()
+                    self._search_cache[key] = (time.monotonic() + self.SEARCH_CACHE_TTL, records)
+            except Exception as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with self._search_lock:
+                    self._search_inflight.pop(key, None)
+
+            future.set_result(records)
+            return records
+        except Exception:
+            # If search fails, return empty list instead of crashing
+            logger.warning("Search failed with criteria=%s", criteria, exc_info=True)
+            return []
+
+    def _search(
+        self,
+        module: str,
+        criteria: Optional[str],
+        email: Optional[str],
+        phone: Optional[str],
+        word: Optional[str],
+        per_page: int
+    ) -> List[Dict]:
+        """Run one search request against the CRM"""
         endpoint = f"/crm/v8/{module}/search"
 
         params = {
@@ -257,13 +844,91 @@ class ZohoCRMClient:
         if word:
             params["word"] = word
 
+        response = self._make_request("GET", endpoint, params=params)
+        return response.get("data", [])
+
+    def queue_update(self, module_name: str, record_id: str, data: Dict) -> None:
+        """
+        Queue a record update to be sent with others in one bulk update
+
+        A background writer collects queued updates for up to
+        WRITE_BATCH_WINDOW seconds (or BULK_UPDATE_LIMIT records) and sends
+        them per module with bulk_update_records. Call flush() to wait until
+        everything queued so far has been sent.
+
+        Args:
+            module_name: Name of the module
+            record_id: ID of the record to update
+            data: Dictionary with field names and values to update
+        """
+        self._ensure_writer()
+        self._write_queue.put((module_name, {**data, "id": record_id}, 1))
+
+    def flush(self) -> None:
+        """Block until every queued update has been sent (or given up on)"""
+        self._write_queue.join()
+
+    @contextmanager
+    def batched_updates(self):
+        """Context manager that flushes queued updates on exit"""
+        try:
+            yield self
+        finally:
+            self.flush()
+
+    def _ensure_writer(self) -> None:
+        """Start the background writer thread if it is not running"""
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="zoho-crm-writer", daemon=True)
+                self._writer.start()
+
+    def _write_loop(self) -> None:
+        """Drain queued updates into per-module bulk updates, forever"""
+        while True:
+            batch = [self._write_queue.get()]
+            deadline = time.monotonic() + self.WRITE_BATCH_WINDOW
+            while len(batch) < self.BULK_UPDATE_LIMIT:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            by_module: Dict[str, list] = {}
+            for item in batch:
+                by_module.setdefault(item[0], []).append(item)
+
+            for module, items in by_module.items():
+                self._send_queued_updates(module, items)
+
+            for _ in batch:
+                self._write_queue.task_done()
+
+    def _send_queued_updates(self, module: str, items: list) -> None:
+        """Send one module's queued updates, re-queueing them with backoff on failure"""
         try:
-            response = self._make_request("GET", endpoint, params=params)
-            return response.get("data", [])
+            response = self.bulk_update_records(module, [record for _, record, _ in items])
         except Exception as e:
-            # If search fails, return empty list instead of crashing
-            print(f"Search failed with criteria: {criteria}, error: {e}")
-            return []
+            retry = [(module, record, attempt + 1) for _, record, attempt in items if attempt < self.WRITE_MAX_ATTEMPTS]
+            if len(retry) < len(items):
+                logger.error("Giving up on %d queued %s updates after %d attempts: %s",
+                             len(items) - len(retry), module, self.WRITE_MAX_ATTEMPTS, e)
+            if retry:
+                attempt = max(item[2] for item in retry) - 1
+                logger.warning("Queued %s update failed (attempt %d), retrying: %s", module, attempt, e)
+                time.sleep(min(2 ** attempt, 30))
+                for item in retry:
+                    self._write_queue.put(item)
+            return
+
+        for result in response.get("data", []):
+            if result.get("code") != "SUCCESS":
+                logger.warning("Queued %s update rejected: %s", module, result)
 
     def update_record(
         self,
@@ -298,20 +963,30 @@ class ZohoCRMClient:
         """
         Bulk update multiple records in Zoho CRM
 
+        Lists longer than BULK_UPDATE_LIMIT are split into chunks that are
+        sent concurrently.
+
         Args:
             module_name: Name of the module
             records: List of dictionaries, each with 'id' and fields to update
 
         Returns:
-            Response from Zoho API with update results
+            Response from Zoho API with update results (for chunked updates,
+            the "data" results of every chunk in input order)
         """
-        endpoint = f"/crm/v2/{module_name}"
+        endpoint = self._module_endpoint(module_name)
 
-        payload = {
-            "data": records
-        }
+        if len(records) <= self.BULK_UPDATE_LIMIT:
+            payload = {
+                "data": records
+            }
+            return self._make_request("PUT", endpoint, json=payload)
 
-        return self._make_request("PUT", endpoint, json=payload)
+        futures = [
+            self._executor.submit(self._make_request, "PUT", endpoint, json={"data": records[i:i + self.BULK_UPDATE_LIMIT]})
+            for i in range(0, len(records), self.BULK_UPDATE_LIMIT)
+        ]
+        return {"data": [item for future in futures for item in future.result().get("data", [])]}
 
     def get_sheet_data(self, sheet_id: Optional[str] = None, worksheet_id: int = 1) -> List[Dict]:
         """
@@ -331,7 +1006,9 @@ class ZohoCRMClient:
         url = f"{self.sheet_base}/api/v2/{sheet}/worksheets/{worksheet_id}/export"
 
         headers = {
-            "Authorization": f"Zoho-oauthtoken {access_token}"
+            "Authorization": f"Zoho-oauthtoken {access_token}",
+            # The export is CSV, not the session's default JSON
+            "Accept": "*/*"
         }
 
         params = {
@@ -339,23 +1016,38 @@ class ZohoCRMClient:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params)
-            response.raise_for_status()
-
-            # Parse CSV to list of dicts
-            import csv
-            import io
+            # Stream the export and parse it as it arrives rather than
+            # holding the whole body as one decoded string first
+            with self.session.get(
+                url, headers=headers, params=params, stream=True, timeout=self.REQUEST_TIMEOUT
+            ) as response:
+                response.raise_for_status()
 
-            csv_data = response.text
-            reader = csv.DictReader(io.StringIO(csv_data))
-            records = list(reader)
+                # Parse CSV to list of dicts. urllib3 closes a Content-Length
+                # response at EOF by default, which makes TextIOWrapper's
+                # final read fail
+                response.raw.decode_content = True
+                response.raw.auto_close = False
+                text = io.TextIOWrapper(response.raw, encoding=response.encoding or "utf-8", newline="")
+                records = list(csv.DictReader(text))
 
             return records
 
-        except Exception as e:
-            print(f"Failed to fetch sheet data: {e}")
+        except Exception:
+            logger.warning("Failed to fetch sheet data", exc_info=True)
             return []
 
 
-# Singleton instance
-zoho_client = ZohoCRMClient()
+# Shared instance, created on first use rather than at import time
+_client: Optional[ZohoCRMClient] = None
+_client_lock = threading.Lock()
+
+
+def get_zoho_client() -> ZohoCRMClient:
+    """Return the shared ZohoCRMClient, creating it on first call"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = ZohoCRMClient()
+    return _client